@@ -13,17 +13,31 @@ class ColorButton(QtWidgets.QPushButton):
         self.updateStyleSheet()
         self.clicked.connect(self.choose_color)
     
-    def updateStyleSheet(self):
-        """색상에 맞게 버튼 스타일시트 업데이트"""
+    def display_color(self):
+        """스타일시트에 사용할 색상 문자열 반환 (ARGB 형식이면 RGB로 변환)"""
         # RGBA 형식으로 들어올 경우 처리
         if self.color.startswith("#") and len(self.color) > 7:
             # ARGB 형식인 경우 RGB로 변환
-            rgb_color = self.color[3:] if len(self.color) == 9 else self.color
-            self.setStyleSheet(f"background-color: {rgb_color}; border: 1px solid black;")
-        else:
-            # 일반적인 색상 포맷
-            self.setStyleSheet(f"background-color: {self.color}; border: 1px solid black;")
-    
+            return self.color[3:] if len(self.color) == 9 else self.color
+        return self.color
+
+    def updateStyleSheet(self):
+        """색상에 맞게 버튼 스타일시트 업데이트"""
+        self.setStyleSheet(f"background-color: {self.display_color()}; border: 1px solid black;")
+
+    def set_color_deferred(self, color):
+        """색상 값만 저장하고 스타일 적용은 apply_pending_color_styles에 맡김
+
+        개별 setStyleSheet는 버튼마다 CSS 파싱을 유발하므로, 여러 버튼을
+        한 번에 갱신할 때는 이 메서드로 색상만 기록한 뒤
+        apply_pending_color_styles()를 1회 호출한다.
+        """
+        self.color = color
+        # 버튼 개별 스타일시트가 남아 있으면 컨테이너 규칙보다 우선하므로 제거
+        if self.styleSheet():
+            self.setStyleSheet("")
+
+
     def choose_color(self):
         """색상 선택 대화상자 표시"""
         # 현재 색상을 QColor로 변환
@@ -48,8 +62,26 @@ class ColorButton(QtWidgets.QPushButton):
                 #     self.parent().apply_settings()
 
 
+def apply_pending_color_styles(buttons, container):
+    """여러 ColorButton의 색상을 컨테이너 스타일시트 1회 적용으로 반영
+
+    Args:
+        buttons: objectName이 지정된 ColorButton 목록
+        container: 버튼들을 담고 있는 부모 위젯 (여기에 통합 스타일시트 적용)
+    """
+    rules = "\n".join(
+        f"QPushButton#{btn.objectName()} {{ background-color: {btn.display_color()}; border: 1px solid black; }}"
+        for btn in buttons
+    )
+    container.setStyleSheet(rules)
+
+
 class FontComboBox(QtWidgets.QFontComboBox):
     """폰트 선택 콤보박스 클래스"""
     def __init__(self, current_font, parent=None):
         super().__init__(parent)
+        # UI가 한국어이므로 한글을 지원하는 폰트만 열거
+        # (전체 폰트 DB 대비 열거 대상이 크게 줄어 첫 표시가 빨라짐)
+        self.setWritingSystem(QtGui.QFontDatabase.Korean)
+        self.setFontFilters(QtWidgets.QFontComboBox.ScalableFonts)
         self.setCurrentFont(QtGui.QFont(current_font))
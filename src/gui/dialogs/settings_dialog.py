@@ -1,13 +1,44 @@
 import os # os 모듈 임포트 추가
+import functools
 from PyQt5 import QtWidgets, QtGui, QtCore
 from PyQt5.QtCore import pyqtSignal # pyqtSignal 임포트 추가
-from ..components.color_button import ColorButton, FontComboBox
+from ..components.color_button import ColorButton, FontComboBox, apply_pending_color_styles
 from ..components.theme_selector import ThemeSelector
+from utils.config import Config
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+
+# 대화상자 고정 스타일시트
+# 위젯별 setStyleSheet로 CSS를 매번 파싱하는 대신, objectName 선택자로 모아
+# 대화상자 생성 시 1회만 파싱되도록 함 (미리보기 라벨 등 정적 스타일 전용)
+_DIALOG_QSS = """
+QDialog { background-color: white; }
+QLabel#header_font_preview {
+    padding: 5px; background-color: #6464C8; color: white; border: 1px solid #CCCCCC;
+}
+QLabel#cell_font_preview {
+    padding: 5px; background-color: white; color: black; border: 1px solid #CCCCCC;
+}
+"""
+
+# 투명도 변환 테이블 (0-255 <-> 0-100%)
+# int(v * 100 / 255) 계산과 동일한 결과를 인덱싱 1회로 얻음
+_OP_255_TO_100 = tuple(v * 100 // 255 for v in range(256))
+_OP_100_TO_255 = tuple(v * 255 // 100 for v in range(101))
+
+
+@functools.lru_cache(maxsize=32)
+def _font_for(family):
+    """폰트 패밀리 문자열에 대한 QFont 캐시 (반복되는 폰트 대체 조회 방지)
+
+    QFont는 Qt 내부에서 참조 카운트로 관리되므로 캐시된 인스턴스를
+    setCurrentFont 등에 그대로 전달해도 안전함 (Qt가 내부 복사).
+    """
+    return QtGui.QFont(family)
+
 class SettingsDialog(QtWidgets.QDialog):
     settings_applied = pyqtSignal() # 설정 적용 시그널 정의
 
@@ -18,11 +49,31 @@ class SettingsDialog(QtWidgets.QDialog):
         self.parent = parent
         self.settings_manager = parent.settings_manager
         self.setWindowTitle("설정")
-        self.setStyleSheet("background-color: white;")  # 배경색을 흰색으로 고정
+        self.setStyleSheet(_DIALOG_QSS)  # 배경색(흰색) 및 정적 미리보기 스타일 일괄 적용
         
         # 초기 설정값 백업 (취소 시 복원용)
         self._backup_initial_settings()
-        
+
+        # 일괄 컨트롤 동기화 중 컨트롤별 프리뷰 갱신 억제 플래그
+        self._updating_controls = False
+        # 일괄 적용 중 on_theme_changed의 부모 스타일 중복 갱신 억제 플래그
+        self._suppress_parent_restyle = False
+
+        # 지연 생성 탭의 컨트롤 존재 여부 플래그 (반복되는 hasattr 탐색 대체)
+        self._has_dual_fonts = False   # 폰트 탭의 콤보박스 생성 완료 여부
+        self._has_size_tab = False     # 크기/위치 탭 생성 완료 여부
+
+        # (SettingsManager 속성, ColorButton 속성) 바인딩 레지스트리
+        # 설정 <-> 컨트롤 양방향 동기화를 루프 한 번으로 처리
+        self._color_bindings = (
+            ("header_bg_color", "header_bg_btn"),
+            ("header_text_color", "header_text_btn"),
+            ("cell_bg_color", "cell_bg_btn"),
+            ("cell_text_color", "cell_text_btn"),
+            ("current_period_color", "current_period_btn"),
+            ("border_color", "border_btn"),
+        )
+
         self.setup_ui()
     
     def _backup_initial_settings(self):
@@ -49,31 +100,50 @@ class SettingsDialog(QtWidgets.QDialog):
             # apply_settings에서 최종 저장되므로, 스타일 관련만 우선 처리.
         }
 
+    # 탭 순서 및 이름 정의 (지연 생성용)
+    TAB_NAMES = ["테마", "색상", "폰트", "알림", "크기/위치", "일반"]
+
+    # 자주 사용하는 스핀박스 범위 상수
+    _FONT_RANGE = (6, 24)        # 폰트 크기 (pt)
+    _WIDTH_RANGE = (200, 800)    # 위젯 너비 (px)
+    _HEIGHT_RANGE = (150, 600)   # 위젯 높이 (px)
+    _WARNING_RANGE = (1, 10)     # 예고 알림 시간 (분)
+
+    @staticmethod
+    def _make_spinbox(min_, max_, value, suffix=""):
+        """범위/초기값/접미사를 한 번에 설정한 QSpinBox 생성 (공용 팩토리)"""
+        spin = QtWidgets.QSpinBox()
+        spin.setRange(min_, max_)
+        spin.setValue(value)
+        if suffix:
+            spin.setSuffix(suffix)
+        return spin
+
     def setup_ui(self):
+        # 구성하는 동안 갱신을 꺼서 행 추가마다 레이아웃을 다시 풀지 않고
+        # 마지막에 한 번만 계산되도록 함
+        self.setUpdatesEnabled(False)
+
         layout = QtWidgets.QVBoxLayout()
-        
+
         # 탭 위젯 생성
         self.tab_widget = QtWidgets.QTabWidget()
         self.tab_widget.setStyleSheet("QTabBar::tab { padding: 8px 16px; }")
-        
-        # === 테마 탭 ===
-        self.setup_theme_tab()
-        
-        # === 색상 탭 ===
-        self.setup_color_tab()
-        
-        # === 폰트 탭 ===
-        self.setup_font_tab()
-        
-        # === 알림 탭 ===
-        self.setup_notification_tab()
-        
-        # === 위젯 크기 탭 ===
-        self.setup_widget_size_tab()
-        
-        # === 일반 탭 ===
-        self.setup_general_tab()
-        
+
+        # 탭 내용은 처음 선택될 때 생성 (지연 생성으로 대화상자 열기 속도 개선)
+        # 우선 자리 표시용 빈 위젯만 추가해 두고, 실제 구성은 _lazy_build_tab에서 수행
+        self._tab_builders = {
+            0: self.setup_theme_tab,
+            1: self.setup_color_tab,
+            2: self.setup_font_tab,
+            3: self.setup_notification_tab,
+            4: self.setup_widget_size_tab,
+            5: self.setup_general_tab,
+        }
+        for name in self.TAB_NAMES:
+            self.tab_widget.addTab(QtWidgets.QWidget(), name)
+        self.tab_widget.currentChanged.connect(self._lazy_build_tab)
+
         # 탭 위젯 추가
         layout.addWidget(self.tab_widget)
         
@@ -95,10 +165,40 @@ class SettingsDialog(QtWidgets.QDialog):
         
         layout.addLayout(buttons_layout)
         self.setLayout(layout)
-        
+
+        # 처음 보이는 탭은 즉시 생성
+        self._lazy_build_tab(0)
+
         # 설정 컨트롤 초기값 로드
         self.update_controls_from_settings()
-    
+
+        # 구성 완료 - 갱신을 다시 켜면서 최종 레이아웃 1회 계산
+        self.setUpdatesEnabled(True)
+
+    def _lazy_build_tab(self, index):
+        """자리 표시용 탭을 실제 내용으로 교체 (탭이 처음 선택될 때 1회만 수행)"""
+        builder = self._tab_builders.pop(index, None)
+        if builder is None:
+            return  # 이미 생성된 탭
+
+        # 탭 교체 중 currentChanged 재진입 방지 + 구성 중 레이아웃 재계산 억제
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            placeholder = self.tab_widget.widget(index)
+            real_widget = builder()
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, real_widget, self.TAB_NAMES[index])
+            self.tab_widget.setCurrentIndex(index)
+            if placeholder is not None:
+                placeholder.deleteLater()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+            self.tab_widget.blockSignals(False)
+
+        # 새로 생성된 컨트롤을 현재 설정값으로 동기화
+        self.update_controls_from_settings()
+
     def setup_theme_tab(self):
         """테마 설정 탭 구성"""
         theme_tab = QtWidgets.QWidget()
@@ -116,7 +216,7 @@ class SettingsDialog(QtWidgets.QDialog):
         
         theme_layout.addStretch()
         theme_tab.setLayout(theme_layout)
-        self.tab_widget.addTab(theme_tab, "테마")
+        return theme_tab
     
     def setup_color_tab(self):
         """색상 설정 탭 구성"""
@@ -128,77 +228,90 @@ class SettingsDialog(QtWidgets.QDialog):
         color_form_layout = QtWidgets.QFormLayout()
         
         # 모든 색상 버튼 설정 및 시그널 연결
+        # objectName은 일괄 스타일 적용(apply_pending_color_styles)의 선택자로 사용됨
         self.header_bg_btn = ColorButton(self.settings_manager.header_bg_color, self)
+        self.header_bg_btn.setObjectName("header_bg_btn")
         self.header_bg_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("헤더 배경색:", self.header_bg_btn)
-        
+
         self.header_text_btn = ColorButton(self.settings_manager.header_text_color, self)
+        self.header_text_btn.setObjectName("header_text_btn")
         self.header_text_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("헤더 텍스트색:", self.header_text_btn)
-        
+
         self.cell_bg_btn = ColorButton(self.settings_manager.cell_bg_color, self)
+        self.cell_bg_btn.setObjectName("cell_bg_btn")
         self.cell_bg_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("셀 배경색:", self.cell_bg_btn)
-        
+
         self.cell_text_btn = ColorButton(self.settings_manager.cell_text_color, self)
+        self.cell_text_btn.setObjectName("cell_text_btn")
         self.cell_text_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("셀 텍스트색:", self.cell_text_btn)
-        
+
         self.current_period_btn = ColorButton(self.settings_manager.current_period_color, self)
+        self.current_period_btn.setObjectName("current_period_btn")
         self.current_period_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("현재 교시 강조색:", self.current_period_btn)
-        
+
         self.border_btn = ColorButton(self.settings_manager.border_color, self)
+        self.border_btn.setObjectName("border_btn")
         self.border_btn.colorChanged.connect(self._preview_style_update)
         color_form_layout.addRow("테두리색:", self.border_btn)
-        
+
         color_group.setLayout(color_form_layout)
+        self._color_group = color_group  # 일괄 스타일 적용 대상 컨테이너
         color_layout.addWidget(color_group)
         
         # 투명도 설정 그룹
+        # 행마다 QHBoxLayout을 중첩하는 대신 그리드 하나로 평탄화
+        # (레이아웃 노드 수가 줄어 리사이즈 시 지오메트리 계산이 1회로 끝남)
         opacity_group = QtWidgets.QGroupBox("투명도 설정")
-        opacity_layout = QtWidgets.QFormLayout()
-        
+        opacity_grid = QtWidgets.QGridLayout()
+        opacity_grid.setColumnStretch(1, 7)  # 슬라이더에 더 많은 공간 할당
+        opacity_grid.setColumnStretch(2, 1)
+
         # 투명도 슬라이더 생성 유틸리티 함수
         def create_opacity_slider_with_label(initial_value):
-            slider_layout = QtWidgets.QHBoxLayout()
             slider = QtWidgets.QSlider(QtCore.Qt.Horizontal)
             slider.setRange(0, 100)  # 0-100% 범위로 변경
-            slider.setValue(int(initial_value * 100 / 255))  # 0-255 값을 0-100%로 변환
-            slider_layout.addWidget(slider, 7)  # 슬라이더에 더 많은 공간 할당
-            # 현재 값 표시 레이블
-            value_label = QtWidgets.QLabel(f"{slider.value()}%")
-            value_label.setMinimumWidth(40)
-            value_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-            slider_layout.addWidget(value_label, 1)
-            # 슬라이더 값이 변경될 때 레이블 업데이트
-            slider.valueChanged.connect(lambda val: value_label.setText(f"{val}%"))
-            
-            return slider_layout, slider
-        
-        # 각 투명도 슬라이더 생성 및 시그널 연결
-        header_slider_layout, self.header_opacity_slider = create_opacity_slider_with_label(self.settings_manager.header_opacity)
-        self.header_opacity_slider.valueChanged.connect(self._preview_style_update)
-        opacity_layout.addRow("헤더 투명도:", header_slider_layout)
-        
-        cell_slider_layout, self.cell_opacity_slider = create_opacity_slider_with_label(self.settings_manager.cell_opacity)
-        self.cell_opacity_slider.valueChanged.connect(self._preview_style_update)
-        opacity_layout.addRow("셀 투명도:", cell_slider_layout)
-        
-        current_period_slider_layout, self.current_period_opacity_slider = create_opacity_slider_with_label(self.settings_manager.current_period_opacity)
-        self.current_period_opacity_slider.valueChanged.connect(self._preview_style_update)
-        opacity_layout.addRow("현재 교시 투명도:", current_period_slider_layout)
-        
-        border_slider_layout, self.border_opacity_slider = create_opacity_slider_with_label(self.settings_manager.border_opacity)
-        self.border_opacity_slider.valueChanged.connect(self._preview_style_update)
-        opacity_layout.addRow("테두리 투명도:", border_slider_layout)
-        
-        opacity_group.setLayout(opacity_layout)
+            slider.setValue(_OP_255_TO_100[initial_value])  # 0-255 값을 0-100%로 변환
+            # 현재 값 표시 스핀박스 (버튼 없는 형태로 레이블처럼 사용)
+            value_spin = QtWidgets.QSpinBox()
+            value_spin.setRange(0, 100)
+            value_spin.setValue(slider.value())
+            value_spin.setSuffix("%")
+            value_spin.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
+            value_spin.setMinimumWidth(40)
+            value_spin.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+            # 슬라이더 <-> 스핀박스 양방향 동기화
+            # (둘 다 C++ 슬롯 직접 연결이라 드래그 중 Python 콜백이 발생하지 않음)
+            slider.valueChanged.connect(value_spin.setValue)
+            value_spin.valueChanged.connect(slider.setValue)
+
+            return slider, value_spin
+
+        # 각 투명도 슬라이더 생성 및 시그널 연결 (그리드 행: 이름 / 슬라이더 / 값)
+        opacity_rows = (
+            ("헤더 투명도:", "header_opacity_slider", self.settings_manager.header_opacity),
+            ("셀 투명도:", "cell_opacity_slider", self.settings_manager.cell_opacity),
+            ("현재 교시 투명도:", "current_period_opacity_slider", self.settings_manager.current_period_opacity),
+            ("테두리 투명도:", "border_opacity_slider", self.settings_manager.border_opacity),
+        )
+        for row, (label_text, attr_name, initial_value) in enumerate(opacity_rows):
+            slider, value_spin = create_opacity_slider_with_label(initial_value)
+            slider.valueChanged.connect(self._preview_style_update)
+            setattr(self, attr_name, slider)
+            opacity_grid.addWidget(QtWidgets.QLabel(label_text), row, 0)
+            opacity_grid.addWidget(slider, row, 1)
+            opacity_grid.addWidget(value_spin, row, 2)
+
+        opacity_group.setLayout(opacity_grid)
         color_layout.addWidget(opacity_group)
         
         color_layout.addStretch()
         color_tab.setLayout(color_layout)
-        self.tab_widget.addTab(color_tab, "색상")
+        return color_tab
         
     def setup_font_tab(self):
         """폰트 설정 탭 구성"""
@@ -209,14 +322,13 @@ class SettingsDialog(QtWidgets.QDialog):
         header_font_group = QtWidgets.QGroupBox("헤더 폰트 설정")
         header_font_layout = QtWidgets.QFormLayout()
         
-        # 헤더 폰트 선택 콤보박스
-        self.header_font_combo = FontComboBox(self.settings_manager.header_font_family, self)
-        header_font_layout.addRow("헤더 폰트:", self.header_font_combo)
-        
+        # 헤더 폰트 콤보박스는 시스템 폰트 열거 비용이 크므로 탭 첫 표시 이후로 생성을 미룸
+        # (self._populate_font_combos 참고)
+        self._header_font_form = header_font_layout
+
         # 헤더 폰트 크기 선택 스핀박스
-        self.header_font_size = QtWidgets.QSpinBox()
-        self.header_font_size.setRange(6, 24)
-        self.header_font_size.setValue(self.settings_manager.header_font_size)
+        self.header_font_size = self._make_spinbox(*self._FONT_RANGE,
+                                                   self.settings_manager.header_font_size)
         header_font_layout.addRow("헤더 폰트 크기:", self.header_font_size)
         
         header_font_group.setLayout(header_font_layout)
@@ -226,14 +338,12 @@ class SettingsDialog(QtWidgets.QDialog):
         cell_font_group = QtWidgets.QGroupBox("셀 폰트 설정")
         cell_font_layout = QtWidgets.QFormLayout()
         
-        # 셀 폰트 선택 콤보박스
-        self.cell_font_combo = FontComboBox(self.settings_manager.cell_font_family, self)
-        cell_font_layout.addRow("셀 폰트:", self.cell_font_combo)
-        
+        # 셀 폰트 콤보박스도 지연 생성 대상
+        self._cell_font_form = cell_font_layout
+
         # 셀 폰트 크기 선택 스핀박스
-        self.cell_font_size = QtWidgets.QSpinBox()
-        self.cell_font_size.setRange(6, 24)
-        self.cell_font_size.setValue(self.settings_manager.cell_font_size)
+        self.cell_font_size = self._make_spinbox(*self._FONT_RANGE,
+                                                 self.settings_manager.cell_font_size)
         cell_font_layout.addRow("셀 폰트 크기:", self.cell_font_size)
         
         cell_font_group.setLayout(cell_font_layout)
@@ -243,38 +353,59 @@ class SettingsDialog(QtWidgets.QDialog):
         preview_group = QtWidgets.QGroupBox("미리보기")
         preview_layout = QtWidgets.QVBoxLayout()
         
-        # 헤더 미리보기
+        # 헤더 미리보기 (스타일은 _DIALOG_QSS에서 objectName으로 지정)
         self.header_font_preview = QtWidgets.QLabel("월 화 수 목 금")
+        self.header_font_preview.setObjectName("header_font_preview")
         self.header_font_preview.setAlignment(QtCore.Qt.AlignCenter)
-        self.header_font_preview.setStyleSheet("padding: 5px; background-color: #6464C8; color: white; border: 1px solid #CCCCCC;")
         preview_layout.addWidget(QtWidgets.QLabel("헤더 미리보기:"))
         preview_layout.addWidget(self.header_font_preview)
-        
-        # 셀 미리보기
+
+        # 셀 미리보기 (스타일은 _DIALOG_QSS에서 objectName으로 지정)
         self.cell_font_preview = QtWidgets.QLabel("1교시: 국어\n2교시: 수학\n3교시: 영어")
+        self.cell_font_preview.setObjectName("cell_font_preview")
         self.cell_font_preview.setAlignment(QtCore.Qt.AlignCenter)
-        self.cell_font_preview.setStyleSheet("padding: 5px; background-color: white; color: black; border: 1px solid #CCCCCC;")
         preview_layout.addWidget(QtWidgets.QLabel("셀 미리보기:"))
         preview_layout.addWidget(self.cell_font_preview)
         
         preview_group.setLayout(preview_layout)
         font_layout.addWidget(preview_group)
         
-        # 폰트 변경 시 미리보기 업데이트 및 스타일 프리뷰 요청
-        self.header_font_combo.currentFontChanged.connect(self._on_font_preview_settings_changed)
+        # 폰트 크기 변경 시 미리보기 업데이트 및 스타일 프리뷰 요청
         self.header_font_size.valueChanged.connect(self._on_font_preview_settings_changed)
-        self.cell_font_combo.currentFontChanged.connect(self._on_font_preview_settings_changed)
         self.cell_font_size.valueChanged.connect(self._on_font_preview_settings_changed)
-        
+
         # 기존 폰트 설정 (호환성 유지)
-        self.font_combo = self.header_font_combo
         self.font_size = self.header_font_size
-        
-        self.update_font_preview()  # 초기 미리보기 설정
-        
+
+        # 폰트 콤보박스 생성(시스템 폰트 DB 열거)은 탭의 첫 페인트 이후로 미룸
+        # -> 탭 전환이 폰트 수와 무관하게 즉시 표시됨
+        QtCore.QTimer.singleShot(0, self._populate_font_combos)
+
         font_layout.addStretch()
         font_tab.setLayout(font_layout)
-        self.tab_widget.addTab(font_tab, "폰트")
+        return font_tab
+
+    def _populate_font_combos(self):
+        """폰트 탭 첫 표시 후 폰트 콤보박스를 생성하고 시그널을 연결"""
+        if hasattr(self, 'header_font_combo'):
+            return  # 이미 생성됨
+
+        # 폰트 DB 열거는 여기서 1회 발생 (탭 표시 이후이므로 체감 지연 없음)
+        self.header_font_combo = FontComboBox(self.settings_manager.header_font_family, self)
+        self._header_font_form.insertRow(0, "헤더 폰트:", self.header_font_combo)
+
+        self.cell_font_combo = FontComboBox(self.settings_manager.cell_font_family, self)
+        self._cell_font_form.insertRow(0, "셀 폰트:", self.cell_font_combo)
+
+        # 폰트 변경 시 미리보기 업데이트 및 스타일 프리뷰 요청
+        self.header_font_combo.currentFontChanged.connect(self._on_font_preview_settings_changed)
+        self.cell_font_combo.currentFontChanged.connect(self._on_font_preview_settings_changed)
+
+        # 기존 폰트 설정 (호환성 유지)
+        self.font_combo = self.header_font_combo
+
+        self._has_dual_fonts = True
+        self.update_font_preview()  # 초기 미리보기 설정
     
     def setup_notification_tab(self):
         """알림 설정 탭 구성"""
@@ -298,10 +429,9 @@ class SettingsDialog(QtWidgets.QDialog):
         # 예고 시간 설정
         warning_layout = QtWidgets.QHBoxLayout()
         warning_layout.addWidget(QtWidgets.QLabel("예고 알림 시간:"))
-        self.warning_minutes = QtWidgets.QSpinBox()
-        self.warning_minutes.setRange(1, 10)
-        self.warning_minutes.setValue(self.parent.notification_manager.warning_minutes)
-        self.warning_minutes.setSuffix(" 분 전")
+        self.warning_minutes = self._make_spinbox(*self._WARNING_RANGE,
+                                                  self.parent.notification_manager.warning_minutes,
+                                                  suffix=" 분 전")
         warning_layout.addWidget(self.warning_minutes)
         warning_layout.addStretch()
         notification_form_layout.addLayout(warning_layout)
@@ -311,7 +441,7 @@ class SettingsDialog(QtWidgets.QDialog):
         notification_layout.addStretch()
         
         notification_tab.setLayout(notification_layout)
-        self.tab_widget.addTab(notification_tab, "알림")
+        return notification_tab
     
     def setup_widget_size_tab(self):
         """위젯 크기 및 위치 설정 탭 구성"""
@@ -327,17 +457,11 @@ class SettingsDialog(QtWidgets.QDialog):
         width = current_size.get("width", 400) if current_size else 400
         height = current_size.get("height", 300) if current_size else 300
         
-        # 너비 및 높이 스핀박스 생성
-        self.widget_width = QtWidgets.QSpinBox()
-        self.widget_width.setRange(200, 800)  # 최소/최대 크기 제한
-        self.widget_width.setValue(width)
-        self.widget_width.setSuffix(" px")
+        # 너비 및 높이 스핀박스 생성 (최소/최대 크기 제한은 클래스 상수 참조)
+        self.widget_width = self._make_spinbox(*self._WIDTH_RANGE, width, suffix=" px")
         size_form_layout.addRow("너비:", self.widget_width)
-        
-        self.widget_height = QtWidgets.QSpinBox()
-        self.widget_height.setRange(150, 600)  # 최소/최대 크기 제한
-        self.widget_height.setValue(height)
-        self.widget_height.setSuffix(" px")
+
+        self.widget_height = self._make_spinbox(*self._HEIGHT_RANGE, height, suffix=" px")
         size_form_layout.addRow("높이:", self.widget_height)
         
         # 미리보기
@@ -348,7 +472,9 @@ class SettingsDialog(QtWidgets.QDialog):
         self.size_preview.setFrameShape(QtWidgets.QFrame.Box)
         self.size_preview.setFrameShadow(QtWidgets.QFrame.Sunken)
         self.size_preview.setMinimumHeight(100)
-        self.size_preview.setStyleSheet("background-color: #F0F0F0;")
+        # 배경/테두리는 여기서 1회만 지정하고, 크기 변경은 setFixedSize로 처리
+        # (매번 setStyleSheet를 호출하면 Qt 스타일 재계산이 발생함)
+        self.size_preview.setStyleSheet("background-color: #F0F0F0; border: 1px solid gray;")
         
         # 미리보기 내부 라벨
         preview_inner_layout = QtWidgets.QVBoxLayout(self.size_preview)
@@ -382,8 +508,15 @@ class SettingsDialog(QtWidgets.QDialog):
         position_group.setLayout(position_layout)
         
         # 위젯 크기 변경 시 미리보기 업데이트
-        self.widget_width.valueChanged.connect(self.update_size_preview)
-        self.widget_height.valueChanged.connect(self.update_size_preview)
+        # 스핀박스 화살표를 누르고 있을 때 연속 발생하는 valueChanged를 50ms 단위로 합침
+        self._size_preview_timer = QtCore.QTimer(self)
+        self._size_preview_timer.setSingleShot(True)
+        self._size_preview_timer.setInterval(50)
+        self._size_preview_timer.timeout.connect(self.update_size_preview)
+        # valueChanged(int)를 start에 바로 연결하면 스핀박스 값이
+        # QTimer.start(msec) 오버로드의 간격으로 해석되므로 인자를 버린다
+        self.widget_width.valueChanged.connect(self._restart_size_preview_timer)
+        self.widget_height.valueChanged.connect(self._restart_size_preview_timer)
         
         # 초기 미리보기 설정
         self.update_size_preview()
@@ -394,7 +527,8 @@ class SettingsDialog(QtWidgets.QDialog):
         size_layout.addStretch()
         
         size_tab.setLayout(size_layout)
-        self.tab_widget.addTab(size_tab, "크기/위치")
+        self._has_size_tab = True
+        return size_tab
     
     def setup_general_tab(self):
         """일반 설정 탭 구성 (부팅시 자동실행 포함)"""
@@ -409,31 +543,24 @@ class SettingsDialog(QtWidgets.QDialog):
         layout.addWidget(self.auto_start_checkbox)
 
         general_tab.setLayout(layout)
-        self.tab_widget.addTab(general_tab, "일반")
+        return general_tab
     
+    def _restart_size_preview_timer(self, _value=None):
+        """스핀박스 값 인자를 버리고 설정된 간격(50ms)으로 디바운스 타이머 재시작"""
+        self._size_preview_timer.start()
+
     def update_size_preview(self):
         """위젯 크기 미리보기 업데이트"""
         # 스케일 비율 (원래 크기의 1/3 정도로 표시)
         scale = 0.3
         scaled_width = int(self.widget_width.value() * scale)
         scaled_height = int(self.widget_height.value() * scale)
-        
-        # 미리보기 라벨 스타일 업데이트
-        style = f"""
-            QFrame {{
-                min-width: {scaled_width}px;
-                max-width: {scaled_width}px;
-                min-height: {scaled_height}px;
-                max-height: {scaled_height}px;
-                background-color: #F0F0F0;
-                border: 1px solid gray;
-            }}
-        """
-        self.size_preview.setStyleSheet(style)
+
+        # 스타일시트 재생성 대신 크기만 직접 변경 (CSS 파서/스타일 재계산 회피)
+        self.size_preview.setFixedSize(scaled_width, scaled_height)
     
     def reset_widget_position(self):
         """위젯 위치를 기본값으로 초기화"""
-        from utils.config import Config
         msg_box = QtWidgets.QMessageBox(self)
         msg_box.setWindowTitle("위치 초기화")
         msg_box.setText("위젯 위치를 화면 왼쪽 상단으로 초기화하시겠습니까?")
@@ -454,48 +581,78 @@ class SettingsDialog(QtWidgets.QDialog):
         """
         # 테마가 변경되면 설정 대화상자의 컨트롤도 업데이트
         self.update_controls_from_settings()
-        
-        # 부모 위젯 스타일 갱신
-        self.parent.update_styles()
+
+        # 부모 위젯 스타일 갱신 (일괄 적용 중에는 apply_settings가 마지막에 1회 갱신)
+        if not self._suppress_parent_restyle:
+            self.parent.update_styles()
     def update_controls_from_settings(self):
-        """설정 매니저의 값으로 컨트롤 업데이트"""
-        # 색상 버튼 업데이트
-        self.header_bg_btn.color = self.settings_manager.header_bg_color
-        self.header_bg_btn.updateStyleSheet()
-        self.header_text_btn.color = self.settings_manager.header_text_color
-        self.header_text_btn.updateStyleSheet()
-        self.cell_bg_btn.color = self.settings_manager.cell_bg_color
-        self.cell_bg_btn.updateStyleSheet()
-        self.cell_text_btn.color = self.settings_manager.cell_text_color
-        self.cell_text_btn.updateStyleSheet()
-        self.current_period_btn.color = self.settings_manager.current_period_color
-        self.current_period_btn.updateStyleSheet()
-        self.border_btn.color = self.settings_manager.border_color
-        self.border_btn.updateStyleSheet()
+        """설정 매니저의 값으로 컨트롤 업데이트 (아직 생성되지 않은 탭의 컨트롤은 건너뜀)"""
+        # 일괄 동기화 중에는 각 컨트롤의 시그널이 _preview_style_update를
+        # 반복 호출하지 않도록 차단 (동기화 종료 후 필요 시 호출자가 갱신)
+        self._updating_controls = True
+        try:
+            self._update_controls_from_settings()
+        finally:
+            self._updating_controls = False
+
+    def _update_controls_from_settings(self):
+        # 색상 버튼 업데이트 (버튼별 setStyleSheet 6회 대신 일괄 1회 적용)
+        if hasattr(self, 'header_bg_btn'):  # 색상 탭이 생성된 경우에만
+            buttons = []
+            for attr, widget_name in self._color_bindings:
+                btn = getattr(self, widget_name)
+                btn.set_color_deferred(getattr(self.settings_manager, attr))
+                buttons.append(btn)
+            apply_pending_color_styles(buttons, self._color_group)
         
         # 투명도 슬라이더 업데이트
         if hasattr(self, 'header_opacity_slider'): # 객체 존재 확인
-            self.header_opacity_slider.setValue(int(self.settings_manager.header_opacity * 100 / 255))
+            self.header_opacity_slider.setValue(_OP_255_TO_100[self.settings_manager.header_opacity])
         if hasattr(self, 'cell_opacity_slider'):
-            self.cell_opacity_slider.setValue(int(self.settings_manager.cell_opacity * 100 / 255))
+            self.cell_opacity_slider.setValue(_OP_255_TO_100[self.settings_manager.cell_opacity])
         if hasattr(self, 'current_period_opacity_slider'):
-            self.current_period_opacity_slider.setValue(int(self.settings_manager.current_period_opacity * 100 / 255))
+            self.current_period_opacity_slider.setValue(_OP_255_TO_100[self.settings_manager.current_period_opacity])
         if hasattr(self, 'border_opacity_slider'):
-            self.border_opacity_slider.setValue(int(self.settings_manager.border_opacity * 100 / 255))
+            self.border_opacity_slider.setValue(_OP_255_TO_100[self.settings_manager.border_opacity])
         
         # 폰트 설정 업데이트
-        if hasattr(self, 'header_font_combo') and hasattr(self, 'cell_font_combo'):
+        if self._has_dual_fonts:
             # 새로운 개별 폰트 설정 적용
-            self.header_font_combo.setCurrentFont(QtGui.QFont(self.settings_manager.header_font_family))
-            self.header_font_size.setValue(self.settings_manager.header_font_size)
-            self.cell_font_combo.setCurrentFont(QtGui.QFont(self.settings_manager.cell_font_family))
-            self.cell_font_size.setValue(self.settings_manager.cell_font_size)
-        else:
+            # 위젯 4개의 개별 시그널이 미리보기를 4회 갱신하지 않도록 차단 후 1회만 갱신
+            with QtCore.QSignalBlocker(self.header_font_combo), \
+                 QtCore.QSignalBlocker(self.header_font_size), \
+                 QtCore.QSignalBlocker(self.cell_font_combo), \
+                 QtCore.QSignalBlocker(self.cell_font_size):
+                self.header_font_combo.setCurrentFont(_font_for(self.settings_manager.header_font_family))
+                self.header_font_size.setValue(self.settings_manager.header_font_size)
+                self.cell_font_combo.setCurrentFont(_font_for(self.settings_manager.cell_font_family))
+                self.cell_font_size.setValue(self.settings_manager.cell_font_size)
+        elif hasattr(self, 'font_combo'):
             # 기존 단일 폰트 설정 호환성 유지
-            self.font_combo.setCurrentFont(QtGui.QFont(self.settings_manager.font_family))
+            self.font_combo.setCurrentFont(_font_for(self.settings_manager.font_family))
             self.font_size.setValue(self.settings_manager.font_size)
+        # 미리보기는 마지막에 1회만 갱신
         self.update_font_preview()
         
+        # 크기/위치 탭 컨트롤 업데이트 — 대화상자 재사용 시 지난번 열었을 때의
+        # 값이 남아 있으면 apply_settings가 그 값으로 위젯을 되돌려 버린다
+        # (설정 밖에서의 모서리 리사이즈·위치 고정 토글이 여기 반영돼야 함)
+        if self._has_size_tab:
+            current_size = self.settings_manager.widget_size
+            with QtCore.QSignalBlocker(self.widget_width), \
+                 QtCore.QSignalBlocker(self.widget_height):
+                self.widget_width.setValue(current_size.get("width", 400) if current_size else 400)
+                self.widget_height.setValue(current_size.get("height", 300) if current_size else 300)
+            self.lock_position.setChecked(self.settings_manager.is_position_locked)
+            self.update_size_preview()
+
+        # 알림 탭 컨트롤 업데이트
+        if hasattr(self, 'notification_enabled'):
+            notification_manager = self.parent.notification_manager
+            self.notification_enabled.setChecked(notification_manager.notification_enabled)
+            self.next_period_warning.setChecked(notification_manager.next_period_warning)
+            self.warning_minutes.setValue(notification_manager.warning_minutes)
+
         # 부팅시 자동실행 체크박스 업데이트
         if hasattr(self, 'auto_start_checkbox'):
             auto_start_enabled = getattr(self.settings_manager, 'auto_start_enabled', False)
@@ -508,21 +665,24 @@ class SettingsDialog(QtWidgets.QDialog):
 
     def _preview_style_update(self):
         """UI 컨트롤 값 변경 시 호출되어 SettingsManager에 임시 적용하고 시그널 발생"""
+        # 일괄 동기화 중에는 생략 (설정값 -> 컨트롤 방향 동기화이므로 역반영 불필요)
+        if self._updating_controls:
+            return
+
         # 현재 UI 컨트롤에서 값 읽어서 SettingsManager에 즉시 반영
-        # 색상
-        self.settings_manager.header_bg_color = self.header_bg_btn.color
-        self.settings_manager.header_text_color = self.header_text_btn.color
-        self.settings_manager.cell_bg_color = self.cell_bg_btn.color
-        self.settings_manager.cell_text_color = self.cell_text_btn.color
-        self.settings_manager.current_period_color = self.current_period_btn.color
-        self.settings_manager.border_color = self.border_btn.color
+        # (아직 생성되지 않은 탭의 컨트롤은 SettingsManager 값이 그대로 유효함)
+        # 색상 (바인딩 레지스트리 기준 역방향 동기화)
+        if hasattr(self, 'header_bg_btn'):
+            for attr, widget_name in self._color_bindings:
+                setattr(self.settings_manager, attr, getattr(self, widget_name).color)
         # 투명도
-        self.settings_manager.header_opacity = int(self.header_opacity_slider.value() * 255 / 100)
-        self.settings_manager.cell_opacity = int(self.cell_opacity_slider.value() * 255 / 100)
-        self.settings_manager.current_period_opacity = int(self.current_period_opacity_slider.value() * 255 / 100)
-        self.settings_manager.border_opacity = int(self.border_opacity_slider.value() * 255 / 100)
+        if hasattr(self, 'header_opacity_slider'):
+            self.settings_manager.header_opacity = _OP_100_TO_255[self.header_opacity_slider.value()]
+            self.settings_manager.cell_opacity = _OP_100_TO_255[self.cell_opacity_slider.value()]
+            self.settings_manager.current_period_opacity = _OP_100_TO_255[self.current_period_opacity_slider.value()]
+            self.settings_manager.border_opacity = _OP_100_TO_255[self.border_opacity_slider.value()]
         # 폰트
-        if hasattr(self, 'header_font_combo') and hasattr(self, 'cell_font_combo'):
+        if self._has_dual_fonts:
             self.settings_manager.header_font_family = self.header_font_combo.currentFont().family()
             self.settings_manager.header_font_size = self.header_font_size.value()
             self.settings_manager.cell_font_family = self.cell_font_combo.currentFont().family()
@@ -550,48 +710,69 @@ class SettingsDialog(QtWidgets.QDialog):
         
     def update_font_preview(self):
         """폰트 미리보기 업데이트"""
+        # 콤보박스가 아직 생성되지 않았으면 미리보기할 내용 없음
+        if not self._has_dual_fonts:
+            return
+
         # 헤더 폰트 미리보기 업데이트
-        if hasattr(self, 'header_font_combo') and hasattr(self, 'header_font_preview'):
-            header_font = self.header_font_combo.currentFont()
-            header_font.setPointSize(self.header_font_size.value())
-            self.header_font_preview.setFont(header_font)
-        
+        header_font = self.header_font_combo.currentFont()
+        header_font.setPointSize(self.header_font_size.value())
+        self.header_font_preview.setFont(header_font)
+
         # 셀 폰트 미리보기 업데이트
-        if hasattr(self, 'cell_font_combo') and hasattr(self, 'cell_font_preview'):
-            cell_font = self.cell_font_combo.currentFont()
-            cell_font.setPointSize(self.cell_font_size.value())
-            self.cell_font_preview.setFont(cell_font)
+        cell_font = self.cell_font_combo.currentFont()
+        cell_font.setPointSize(self.cell_font_size.value())
+        self.cell_font_preview.setFont(cell_font)
         
     def apply_settings(self):
         """현재 SettingsManager에 반영된 설정들을 파일에 저장하고, 기타 설정 적용"""
+        # 적용 마지막의 settings_applied 시그널이 부모 스타일을 1회 갱신하므로,
+        # 적용 도중 on_theme_changed 경유의 중복 갱신은 억제
+        self._suppress_parent_restyle = True
+        try:
+            self._apply_settings_impl()
+        finally:
+            self._suppress_parent_restyle = False
+
+        self.settings_applied.emit() # 설정 적용 완료 시그널 발생 (UI 업데이트 트리거)
+
+    def _apply_settings_impl(self):
         # 스타일 관련 설정은 _preview_style_update에서 이미 SettingsManager 객체에 반영됨.
-        # 여기서는 해당 내용을 파일에 저장하는 역할.
-        self.settings_manager.save_style_settings()
+        # 백업본(initial_settings)과 비교해 실제로 변경된 경우에만 파일에 저장
+        sm = self.settings_manager
+        style_dirty = any(getattr(sm, key) != value
+                          for key, value in self.initial_settings.items())
+        if style_dirty:
+            sm.save_style_settings()
+            # 저장한 값을 새 기준으로 백업 (같은 세션에서 반복 적용 시 중복 저장 방지)
+            self._backup_initial_settings()
 
         # 알림 설정 적용 및 저장 (NotificationManager는 자체 저장 로직 사용)
-        notification_manager = self.parent.notification_manager
-        notification_manager.set_notification_enabled(self.notification_enabled.isChecked())
-        notification_manager.set_next_period_warning(self.next_period_warning.isChecked())
-        notification_manager.set_warning_minutes(self.warning_minutes.value())
-        notification_manager.save_notification_settings()
+        # 알림 탭이 생성되지 않았으면 NotificationManager의 기존 값이 그대로 유효함
+        if hasattr(self, 'notification_enabled'):
+            notification_manager = self.parent.notification_manager
+            notification_manager.set_notification_enabled(self.notification_enabled.isChecked())
+            notification_manager.set_next_period_warning(self.next_period_warning.isChecked())
+            notification_manager.set_warning_minutes(self.warning_minutes.value())
+            notification_manager.save_notification_settings()
         
         # 위젯 크기 및 위치 설정 적용
         try:
-            # 이전 크기/위치 정보 백업
-            old_size = self.settings_manager.widget_size.copy() if self.settings_manager.widget_size else {}
-            old_position = self.settings_manager.widget_position.copy() if self.settings_manager.widget_position else {}
-            
+            # 이전 크기 비교용 스칼라만 읽음 (dict 복사 불필요 -
+            # save_widget_position은 dict를 교체하므로 저장 전 값으로 충분)
+            old_width = (self.settings_manager.widget_size or {}).get('width')
+            old_height = (self.settings_manager.widget_size or {}).get('height')
+
             # 새로운 크기 설정
-            if hasattr(self, 'widget_width') and hasattr(self, 'widget_height'):
+            if self._has_size_tab:
                 new_size = {
                     "width": self.widget_width.value(),
                     "height": self.widget_height.value()
                 }
-                
+
                 # 위치 고정 상태 업데이트
-                if hasattr(self, 'lock_position'):
-                    is_locked = self.lock_position.isChecked()
-                    self.settings_manager.set_position_lock(is_locked)
+                is_locked = self.lock_position.isChecked()
+                self.settings_manager.set_position_lock(is_locked)
                 
                 # 위젯 위치와 크기 정보 저장
                 # x, y 좌표는 settings_manager에 저장된 현재 값을 사용 (SettingsDialog에서 직접 위치를 바꾸는 UI는 없음)
@@ -629,9 +810,9 @@ class SettingsDialog(QtWidgets.QDialog):
                 )
                 
                 # 부모 위젯 크기 업데이트 (값이 변경된 경우만)
-                if (old_size.get('width') != new_size['width'] or
-                    old_size.get('height') != new_size['height']):
-                    logger.info(f"위젯 크기 변경: {old_size} -> {new_size}")
+                if (old_width != new_size['width'] or
+                    old_height != new_size['height']):
+                    logger.info(f"위젯 크기 변경: ({old_width}, {old_height}) -> {new_size}")
                     self.parent.resize(new_size['width'], new_size['height'])
         except Exception as e:
             logger.error(f"위젯 크기 설정 적용 중 오류: {e}")
@@ -673,14 +854,10 @@ class SettingsDialog(QtWidgets.QDialog):
                     QtWidgets.QMessageBox.warning(self, "오류", "자동 시작을 비활성화하지 못했습니다.")
                     # 실패 시 UI나 설정을 되돌릴 필요는 없을 수 있음 (이미 비활성화 시도)
         
-        # 설정 파일에 저장 (set_auto_start 내부에서 widget_settings.json 저장, 다른 스타일은 여기서 저장)
-        self.settings_manager.save_style_settings() # 스타일 관련 설정만 저장
-        
-        # 부모 위젯 스타일 갱신 (시그널로 대체 가능)
-        # self.parent.update_styles() # 이 부분은 시그널로 처리되므로 주석 처리하거나 삭제 가능
-        
-        self.settings_applied.emit() # 설정 적용 완료 시그널 발생 (UI 업데이트 트리거)
-    
+        # 스타일 설정 저장은 메서드 상단의 변경 감지에서 1회 처리됨
+        # (자동 시작 설정은 set_auto_start 내부에서 widget_settings.json에 저장)
+        # 부모 위젯 스타일 갱신은 apply_settings 말미의 settings_applied 시그널이 1회 처리
+
     def reject(self):
         """취소 버튼 클릭 시 초기 설정으로 복원하고 대화상자 닫기"""
         sm = self.settings_manager
@@ -1,7 +1,8 @@
 from PyQt5 import QtWidgets, QtGui, QtCore
 import sys
 import os
-import datetime
+import time
+import functools
 import json
 import logging
 
@@ -18,13 +19,29 @@ from utils.styling import (
     hex_to_rgba, generate_header_style, generate_cell_style, 
     generate_current_style, generate_drag_style
 )
+
+# 스타일 문자열 생성은 같은 설정값으로 반복 호출되므로 결과를 메모이즈
+# (hex 파싱 + 문자열 포맷이 update_styles의 가장 비싼 파이썬 작업)
+hex_to_rgba = functools.lru_cache(maxsize=64)(hex_to_rgba)
+generate_header_style = functools.lru_cache(maxsize=16)(generate_header_style)
+generate_cell_style = functools.lru_cache(maxsize=16)(generate_cell_style)
+generate_current_style = functools.lru_cache(maxsize=16)(generate_current_style)
+generate_drag_style = functools.lru_cache(maxsize=16)(generate_drag_style)
+
 from .dialogs.time_dialog import TimeRangeDialog
 from .dialogs.settings_dialog import SettingsDialog
 from .dialogs.timetable_dialog import TimetableEditDialog
 
-# 로거 설정
+# 로거 설정 (핸들러/레벨 구성은 애플리케이션 진입점 몫)
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG)
+
+# 교시 키 문자열 (timetable_data의 키) — 루프마다 str() 호출 방지
+_PERIOD_STRS = ("1", "2", "3", "4", "5", "6", "7")
+
+# 마우스 이동 이벤트 스로틀 간격 (ms)
+# 고주사율 마우스(폴링 1kHz)에서는 mouseMoveEvent가 페인트보다 훨씬 자주 들어오므로
+# 이 간격 안에 도착한 이벤트는 마지막 위치만 남기고 병합한다
+_MOVE_THROTTLE_MS = 10
 
 # 드래그/리사이징 관련 로직을 별도 믹스인 클래스로 분리
 class DragResizeMixin:
@@ -34,70 +51,122 @@ class DragResizeMixin:
         self.drag_start_pos = None
         self.resize_start_pos = None
         self.initial_size = self.size()
+        # 드래그 모드 헤더 스타일 캐시 (설정 변경 시 update_styles가 무효화)
+        self._drag_style = None
+        # 마우스 이동 스로틀링 상태
+        self._last_move_ms = 0.0
+        self._pending_move_pos = None
+        self._move_flush_scheduled = False
+        # 리사이즈 핫존 (resizeEvent에서만 갱신, 매 이벤트 재계산 방지)
+        self._resize_corner = QtCore.QRect(self.width() - 20, self.height() - 20, 20, 20)
+
+    def resizeEvent(self, event):
+        # 우하단 리사이즈 핫존은 크기가 바뀔 때만 다시 계산
+        self._resize_corner = QtCore.QRect(self.width() - 20, self.height() - 20, 20, 20)
+        super().resizeEvent(event)
     
     def handle_mouse_press(self, event):
-        if event.button() == QtCore.Qt.LeftButton:
-            # 위치가 고정되어 있으면 크기 조절만 허용
-            if self.settings_manager.is_position_locked:
-                if event.pos().x() >= self.rect().width() - 20 and event.pos().y() >= self.rect().height() - 20:
-                    self.resizing = True
-                    self.resize_start_pos = event.globalPos()
-                    self.initial_size = self.size()
-                    self.setCursor(QtCore.Qt.SizeFDiagCursor)
-            else:
-                # 위치 고정이 아닐 때는 기존과 동일하게 동작
-                if event.pos().x() >= self.rect().width() - 20 and event.pos().y() >= self.rect().height() - 20:
-                    self.resizing = True
-                    self.resize_start_pos = event.globalPos()
-                    self.initial_size = self.size()
-                    self.setCursor(QtCore.Qt.SizeFDiagCursor)
-                else:
-                    self.dragging = True
-                    self.drag_start_pos = event.globalPos() - self.frameGeometry().topLeft()
-                    self.setCursor(QtCore.Qt.ClosedHandCursor)
-                    # 드래그 모드에서 스타일 변경
-                    drag_bg_rgba = hex_to_rgba(self.settings_manager.header_bg_color, self.settings_manager.header_opacity)
-                    border_rgba = hex_to_rgba(self.settings_manager.border_color, self.settings_manager.border_opacity)
-                    drag_style = generate_drag_style(
-                        drag_bg_rgba, 
-                        self.settings_manager.header_text_color, 
-                        border_rgba,
-                        self.settings_manager.font_family,
-                        self.settings_manager.font_size
-                    )
-                    for header in self.day_headers.values():
-                        header.setStyleSheet(drag_style)
+        if event.button() != QtCore.Qt.LeftButton:
+            return
+        # 모서리 리사이즈는 잠금 여부와 무관하게 동일 동작 — 검사도 한 번만
+        if self._resize_corner.contains(event.pos()):
+            self.resizing = True
+            self.resize_start_pos = event.globalPos()
+            self.initial_size = self.size()
+            self.setCursor(QtCore.Qt.SizeFDiagCursor)
+            return
+        # 위치가 고정되어 있으면 드래그 시작 안 함
+        if self.settings_manager.is_position_locked:
+            return
+        self.dragging = True
+        self.drag_start_pos = event.globalPos() - self.frameGeometry().topLeft()
+        self.setCursor(QtCore.Qt.ClosedHandCursor)
+        # 드래그 모드 스타일: 설정이 바뀔 때까지 재사용
+        # (속성 체인 접근은 지역 변수로 묶어 1회만)
+        drag_style = self._drag_style
+        if drag_style is None:
+            sm = self.settings_manager
+            drag_style = generate_drag_style(
+                hex_to_rgba(sm.header_bg_color, sm.header_opacity),
+                sm.header_text_color,
+                hex_to_rgba(sm.border_color, sm.border_opacity),
+                sm.font_family,
+                sm.font_size
+            )
+            self._drag_style = drag_style
+        for header in self._day_header_labels:
+            header.setStyleSheet(drag_style)
     
     def handle_mouse_move(self, event):
-        if self.resizing:
-            diff = event.globalPos() - self.resize_start_pos
-            new_width = max(self.minimumWidth(), self.initial_size.width() + diff.x())
-            new_height = max(self.minimumHeight(), self.initial_size.height() + diff.y())
-            self.resize(new_width, new_height)
-        elif self.dragging and event.buttons() == QtCore.Qt.LeftButton and not self.settings_manager.is_position_locked:
-            # 위치 고정이 아닐 때만 드래그 허용
-            self.move(event.globalPos() - self.drag_start_pos)
+        # 좌클릭 여부는 등호 비교 대신 비트 검사로 확인
+        # (Shift 등 다른 버튼/키가 섞여도 드래그가 끊기지 않음)
+        if self.resizing or (
+            self.dragging and (event.buttons() & QtCore.Qt.LeftButton)
+            and not self.settings_manager.is_position_locked
+        ):
+            # 스로틀 간격 내에 들어온 이벤트는 마지막 위치만 보관하고
+            # 단발성 타이머로 지연 반영 (프레임당 resize/move 1회로 제한)
+            now_ms = time.monotonic() * 1000.0
+            remaining = _MOVE_THROTTLE_MS - (now_ms - self._last_move_ms)
+            if remaining > 0:
+                self._pending_move_pos = event.globalPos()
+                if not self._move_flush_scheduled:
+                    self._move_flush_scheduled = True
+                    QtCore.QTimer.singleShot(int(remaining) + 1, self._flush_pending_move)
+                return
+            self._last_move_ms = now_ms
+            self._apply_move(event.globalPos())
         else:
-            if event.pos().x() >= self.rect().width() - 20 and event.pos().y() >= self.rect().height() - 20:
+            if self._resize_corner.contains(event.pos()):
                 self.setCursor(QtCore.Qt.SizeFDiagCursor)
             else:
                 self.setCursor(QtCore.Qt.ArrowCursor)
-    
+
+    def _apply_move(self, global_pos):
+        """스로틀을 통과한 마우스 위치를 실제 resize/move로 반영"""
+        if self.resizing:
+            diff = global_pos - self.resize_start_pos
+            new_width = max(self.minimumWidth(), self.initial_size.width() + diff.x())
+            new_height = max(self.minimumHeight(), self.initial_size.height() + diff.y())
+            self.resize(new_width, new_height)
+        elif self.dragging:
+            # 위치 고정이 아닐 때만 드래그 허용 (호출 전에 검사됨)
+            self.move(global_pos - self.drag_start_pos)
+
+    def _flush_pending_move(self):
+        """스로틀 대기 중 보관해 둔 마지막 마우스 위치를 반영"""
+        self._move_flush_scheduled = False
+        pos = self._pending_move_pos
+        # 타이머 대기 중 드래그/리사이징이 끝났으면 무시
+        if pos is None or not (self.resizing or self.dragging):
+            return
+        self._pending_move_pos = None
+        self._last_move_ms = time.monotonic() * 1000.0
+        self._apply_move(pos)
+
     def handle_mouse_release(self, event):
         if event.button() == QtCore.Qt.LeftButton:
             self.resizing = False
             self.dragging = False
             self.setCursor(QtCore.Qt.ArrowCursor)
+            # 드래그 중 헤더에 덮어쓴 개별 스타일 제거
+            # (위젯 단위 role 선택자 규칙이 다시 적용되도록)
+            for header in self._day_header_labels:
+                header.setStyleSheet("")
             self.update_styles()
             # 위치 및 크기 저장
             self.save_widget_position()
 
 class Widget(DragResizeMixin, QtWidgets.QWidget):
+    # 지연 임포트한 대화상자 클래스 캐시 (최초 임포트 비용은 유지하되
+    # 이후 우클릭부터는 importlib 조회 없이 속성 접근만)
+    _QRShareDialog = None
+    _ImportDialog = None
+    _BackupRestoreDialog = None
+
     def __init__(self, settings_manager=None, notification_manager=None, app_manager=None, parent=None):
         super().__init__(parent) # parent 인자 전달
-        # 타이머 초기화 코드 추가
-        self.timer = QtCore.QTimer() # self.timer는 여기서 초기화하는 것이 적절
-        
+
         # 전달된 매니저 인스턴스 사용, 없으면 새로 생성 (main.py에서 전달하므로 settings_manager 등은 None이 아닐 것임)
         self.settings_manager = settings_manager if settings_manager else SettingsManager.get_instance()
         self.notification_manager = notification_manager if notification_manager else NotificationManager.get_instance()
@@ -115,18 +184,27 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         # 현재 교시 및 요일 정보 초기화
         self.current_period = None
         self.current_day_idx = None
+
+        # 마지막으로 적용한 스타일 설정의 지문 (동일하면 재생성 생략)
+        self._last_style_key = None
+        # (폰트, 테두리) 조합별 부분 평가된 스타일 템플릿 캐시
+        self._style_template_cache = {}
         
         # 위젯 초기화
         self.init_ui()
-        
-        # 현재 시간에 맞는 교시 하이라이트
-        self.update_current_period()
-        
-        # 타이머 설정 (매 분마다 현재 교시 업데이트)
+
+        # 타이머 설정: 주기적 폴링 대신 다음 교시 변경 시각에 맞춘 단발성 예약
+        # (timeout마다 update_current_period가 다음 예약을 다시 잡는다)
         self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_current_period)
-        self.timer.start(60000)  # 60초 (1분) 마다 실행
-        
+        # 종료 시 중지 대상으로 등록 (findChildren 전체 탐색 회피)
+        if self.app_manager and hasattr(self.app_manager, 'register_timer'):
+            self.app_manager.register_timer(self.timer)
+
+        # 현재 시간에 맞는 교시 하이라이트 (내부에서 다음 갱신을 예약)
+        self.update_current_period()
+
         # 드래그 및 리사이징 관련 변수 초기화
         self.init_drag_resize()
         
@@ -135,6 +213,8 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         self.customContextMenuRequested.connect(self.show_context_menu)
         
         self.cleanup_on_close = None  # 종료 시 호출할 정리 함수
+        self._settings_dialog = None  # 설정 대화상자 캐시 (반복 열기 시 재구성 비용 절감)
+        self._context_menu = None  # 우클릭 메뉴 캐시 (액션 8개 재생성 방지)
     
     def init_ui(self):
         """UI 초기화"""
@@ -149,20 +229,25 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(0)
         
+        # 그리드를 채우는 동안 증분 리페인트 예약 억제
+        # (addWidget 48회가 각각 레이아웃 무효화를 밀어넣지 않도록 일괄 처리)
+        self.setUpdatesEnabled(False)
+
         # 시간표 그리드 레이아웃
         self.grid_layout = QtWidgets.QGridLayout()
         self.grid_layout.setSpacing(4)
-        
+        self.grid_layout.setContentsMargins(0, 0, 0, 0)
+
         # 요일 헤더 생성 (1행)
         self.day_headers = {}
         days = ["", "월", "화", "수", "목", "금"]
         for col, day in enumerate(days):
             label = QtWidgets.QLabel(day)
             label.setAlignment(QtCore.Qt.AlignCenter)
+            label.setProperty("role", "header")  # 스타일시트 선택자용
             # 마우스 이벤트 추적 설정
             label.setMouseTracking(True)
-            label.enterEvent = lambda event, lbl=label: self.on_label_hover_enter(event, lbl)
-            label.leaveEvent = lambda event, lbl=label: self.on_label_hover_leave(event, lbl)
+            label.installEventFilter(self)
             self.grid_layout.addWidget(label, 0, col)
             self.day_headers[col] = label
         
@@ -174,10 +259,10 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
             # 교시 헤더 (첫 번째 열)
             period_label = QtWidgets.QLabel(f"{row}")
             period_label.setAlignment(QtCore.Qt.AlignCenter)
+            period_label.setProperty("role", "header")
             # 마우스 이벤트 추적 설정
             period_label.setMouseTracking(True)
-            period_label.enterEvent = lambda event, lbl=period_label: self.on_label_hover_enter(event, lbl)
-            period_label.leaveEvent = lambda event, lbl=period_label: self.on_label_hover_leave(event, lbl)
+            period_label.installEventFilter(self)
             self.grid_layout.addWidget(period_label, row, 0)
             self.period_headers[row] = period_label
             
@@ -186,16 +271,29 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
                 cell = QtWidgets.QLabel()
                 cell.setAlignment(QtCore.Qt.AlignCenter)
                 cell.setWordWrap(True)
+                cell.setProperty("role", "cell")
                 # 마우스 이벤트 추적 설정
                 cell.setMouseTracking(True)
-                cell.enterEvent = lambda event, c=cell: self.on_cell_hover_enter(event, c)
-                cell.leaveEvent = lambda event, c=cell: self.on_cell_hover_leave(event, c)
+                cell.installEventFilter(self)
                 self.grid_layout.addWidget(cell, row, col)
                 self.cell_widgets[(row, col)] = cell
         
+        # 핫 루프용 평탄화 시퀀스 (매 호출 dict 이터레이션 재구성 방지)
+        self._day_header_labels = tuple(self.day_headers.values())
+        self._cells_flat = tuple(self.cell_widgets.items())
+
+        # eventFilter에서 라벨 종류를 구분하기 위한 집합
+        self._header_label_set = frozenset(
+            self._day_header_labels + tuple(self.period_headers.values())
+        )
+        self._cell_label_set = frozenset(self.cell_widgets.values())
+
         main_layout.addLayout(self.grid_layout)
         self.setLayout(main_layout)
-        
+
+        # 구성 완료 — 지오메트리 계산과 리페인트를 한 번에
+        self.setUpdatesEnabled(True)
+
         # 스타일 적용
         self.update_styles()
         
@@ -210,24 +308,25 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         """
         pos = self.settings_manager.widget_position
         size = self.settings_manager.widget_size
-        screen_info = getattr(self.settings_manager, 'widget_screen_info', None)
+        # SettingsManager.__init__이 항상 widget_screen_info를 초기화하므로
+        # getattr 폴백 없이 직접 속성 접근
+        screen_info = self.settings_manager.widget_screen_info
 
-        # 현재 연결된 모든 스크린 정보
-        screens = QtWidgets.QApplication.screens()
+        # 현재 연결된 모든 스크린 (이름 → 스크린 해시 조회용)
+        screens_by_name = {s.name(): s for s in QtWidgets.QApplication.screens()}
         target_screen = None
 
-        # 저장된 스크린 정보가 있으면 해당 스크린 찾기 (geometry 우선, name fallback)
+        # 저장된 스크린 정보가 있으면 이름으로 O(1) 조회 우선,
+        # 실패 시에만 geometry 튜플 비교로 선형 fallback
         if screen_info:
-            for screen in screens:
-                if (
-                    'geometry' in screen_info and
-                    screen.geometry().getRect() == tuple(screen_info['geometry'])
-                ) or (
-                    'name' in screen_info and
-                    screen.name() == screen_info['name']
-                ):
-                    target_screen = screen
-                    break
+            target_screen = screens_by_name.get(screen_info.get('name'))
+            if target_screen is None and 'geometry' in screen_info:
+                geom_tuple = tuple(screen_info['geometry'])
+                target_screen = next(
+                    (s for s in screens_by_name.values()
+                     if s.geometry().getRect() == geom_tuple),
+                    None
+                )
         # 없으면 primaryScreen 사용
         if not target_screen:
             target_screen = QtWidgets.QApplication.primaryScreen()
@@ -287,61 +386,99 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
                 'geometry': screen.geometry().getRect(),  # (x, y, w, h)
                 'name': screen.name()
             }
-        logger.debug(f"Saving widget position. Screen info: {screen_info}, Widget pos: {pos}, Widget size: {size}")
+        # 지연 포맷: DEBUG 비활성 시 문자열 생성 비용 없음
+        logger.debug("Saving widget position. Screen info: %s, Widget pos: %s, Widget size: %s",
+                     screen_info, pos, size)
         self.settings_manager.save_widget_position(pos.x(), pos.y(), size.width(), size.height(), screen_info)
     
     def update_styles(self):
         """모든 위젯에 현재 스타일 설정 적용"""
         # 스타일 정보 가져오기
         sm = self.settings_manager
-        
+
+        # 설정 지문이 그대로면 스타일시트 재생성/재적용 생략
+        # (role 전환만 반영하면 됨 — 설정 미변경 타이머 틱/드래그 해제 경로)
+        style_key = (
+            sm.header_bg_color, sm.header_opacity, sm.header_text_color,
+            sm.cell_bg_color, sm.cell_opacity, sm.cell_text_color,
+            sm.current_period_color, sm.current_period_opacity,
+            sm.border_color, sm.border_opacity,
+            sm.header_font_family, sm.header_font_size,
+            sm.cell_font_family, sm.cell_font_size,
+            sm.font_family, sm.font_size,  # 드래그 스타일이 사용하는 공통 폰트
+        )
+        if style_key == self._last_style_key:
+            self._apply_current_role()
+            return
+        self._last_style_key = style_key
+        self._drag_style = None  # 설정이 바뀌었으므로 드래그 스타일 캐시 무효화
+
         # 헤더 배경색을 RGBA 형식으로 변환
         header_bg_rgba = hex_to_rgba(sm.header_bg_color, sm.header_opacity)
         cell_bg_rgba = hex_to_rgba(sm.cell_bg_color, sm.cell_opacity)
         current_bg_rgba = hex_to_rgba(sm.current_period_color, sm.current_period_opacity)
         border_rgba = hex_to_rgba(sm.border_color, sm.border_opacity)
         
-        # 헤더 스타일 적용 - 개별 헤더 폰트 사용
-        header_style = generate_header_style(
-            header_bg_rgba, 
-            sm.header_text_color, 
-            sm.header_font_family,  # 헤더 전용 폰트
-            sm.header_font_size     # 헤더 폰트 크기
-        )
-        
-        # 셀 스타일 적용 - 개별 셀 폰트 사용
-        cell_style = generate_cell_style(
-            cell_bg_rgba, 
-            sm.cell_text_color, 
-            border_rgba, 
-            sm.cell_font_family,    # 셀 전용 폰트
-            sm.cell_font_size       # 셀 폰트 크기
-        )
-        
-        # 현재 교시 스타일 적용 - 개별 셀 폰트 사용
-        current_style = generate_current_style(
-            current_bg_rgba, 
-            sm.cell_text_color, 
-            border_rgba, 
-            sm.cell_font_family,    # 셀 전용 폰트
-            sm.cell_font_size       # 셀 폰트 크기
+        # 변경 빈도가 낮은 (폰트, 테두리) 조합으로 부분 평가된 템플릿을 캐시하고,
+        # 자주 바뀌는 배경/글자색 토큰만 치환해 최종 CSS를 만든다
+        tmpl_key = (
+            sm.header_font_family, sm.header_font_size,
+            sm.cell_font_family, sm.cell_font_size,
+            border_rgba,
         )
+        templates = self._style_template_cache.get(tmpl_key)
+        if templates is None:
+            templates = (
+                # 헤더 템플릿 - 개별 헤더 폰트 사용
+                generate_header_style(
+                    "__BG__", "__FG__", sm.header_font_family, sm.header_font_size
+                ),
+                # 셀 템플릿 - 개별 셀 폰트 사용
+                generate_cell_style(
+                    "__BG__", "__FG__", border_rgba, sm.cell_font_family, sm.cell_font_size
+                ),
+                # 현재 교시 강조 템플릿 - 개별 셀 폰트 사용
+                generate_current_style(
+                    "__BG__", "__FG__", border_rgba, sm.cell_font_family, sm.cell_font_size
+                ),
+            )
+            self._style_template_cache[tmpl_key] = templates
+
+        header_style = templates[0].replace("__BG__", header_bg_rgba).replace("__FG__", sm.header_text_color)
+        cell_style = templates[1].replace("__BG__", cell_bg_rgba).replace("__FG__", sm.cell_text_color)
+        current_style = templates[2].replace("__BG__", current_bg_rgba).replace("__FG__", sm.cell_text_color)
         
-        # 요일 헤더 스타일 적용
-        for col, label in self.day_headers.items():
-            label.setStyleSheet(header_style)
-        
-        # 교시 헤더 스타일 적용
-        for row, label in self.period_headers.items():
-            label.setStyleSheet(header_style)
-        
-        # 셀 스타일 적용
-        for (row, col), cell in self.cell_widgets.items():
-            # 현재 교시이면 강조 스타일 적용
-            if row == self.current_period and col == self.current_day_idx:
-                cell.setStyleSheet(current_style)
-            else:
-                cell.setStyleSheet(cell_style)
+        # 스타일시트 교체 + role 재적용이 유발하는 repaint를 1회로 병합
+        self.setUpdatesEnabled(False)
+        try:
+            # 48개 위젯에 개별 setStyleSheet(위젯마다 CSS 재파싱 유발)하는 대신
+            # role 프로퍼티 선택자로 묶어 위젯 전체에 1회만 적용
+            self.setStyleSheet(
+                f'QLabel[role="header"] {{ {header_style} }}\n'
+                f'QLabel[role="cell"] {{ {cell_style} }}\n'
+                f'QLabel[role="current"] {{ {current_style} }}'
+            )
+
+            # 현재 교시 셀에만 role="current" 부여
+            self._apply_current_role()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _set_cell_role(self, cell, role):
+        """셀의 role 프로퍼티를 변경하고 해당 셀만 다시 polish"""
+        if cell is None or cell.property("role") == role:
+            return
+        cell.setProperty("role", role)
+        style = cell.style()
+        style.unpolish(cell)
+        style.polish(cell)
+
+    def _apply_current_role(self):
+        """현재 교시에 해당하는 셀만 강조 role로 전환 (변경된 셀만 polish됨)"""
+        current_key = (self.current_period, self.current_day_idx)
+        for key, cell in self._cells_flat:
+            self._set_cell_role(cell, "current" if key == current_key else "cell")
     
     def update_timetable_display(self):
         """시간표 데이터를 화면에 표시"""
@@ -350,31 +487,43 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         timetable_data = self.settings_manager.timetable_data
         
         for day_idx, day in enumerate(days, 1):
-            for period in range(1, 8):
+            day_map = timetable_data.get(day, {})  # 요일별 dict는 한 번만 조회
+            for period, period_str in enumerate(_PERIOD_STRS, 1):
                 cell = self.cell_widgets.get((period, day_idx))
                 if cell:
                     # 해당 요일과 교시에 맞는 과목 가져오기
-                    subject = timetable_data.get(day, {}).get(str(period), "")
-                    cell.setText(subject)
+                    subject = day_map.get(period_str, "")
+                    # 내용이 같으면 setText(와 그에 따른 repaint) 생략
+                    if cell.text() != subject:
+                        cell.setText(subject)
     
     def update_current_period(self):
         """현재 시간에 맞는 교시 계산"""
-        now = QtCore.QTime.currentTime()
-        today = datetime.datetime.now().weekday()  # 0=월요일, 1=화요일, ..., 6=일요일
+        # 시계는 한 번만 읽고 요일/시각을 모두 파생 (클럭 조회 2회 → 1회)
+        dt = QtCore.QDateTime.currentDateTime()
+        now = dt.time()
+        today = dt.date().dayOfWeek() - 1  # 0=월요일, 1=화요일, ..., 6=일요일
         
+        # 이전 현재 교시/요일 저장
+        prev_period = self.current_period
+        prev_day_idx = self.current_day_idx
+
         # 주말이 아닌 경우에만 요일 인덱스 계산 (인덱스 1=월, 2=화, ..., 5=금)
         self.current_day_idx = today + 1 if 0 <= today <= 4 else None
-        
-        # 이전 현재 교시 저장
-        prev_period = self.current_period
-        
+
         # 현재 교시 계산
         self.current_period = self.settings_manager.get_current_period(now)
-        
-        # 현재 교시가 변경되었으면 스타일 업데이트 및 알림
+
+        # 강조 셀이 바뀌었으면 영향을 받는 두 셀의 role만 교체
+        # (전체 update_styles는 설정 변경 경로에서만 필요)
+        if (prev_period, prev_day_idx) != (self.current_period, self.current_day_idx):
+            self._set_cell_role(self.cell_widgets.get((prev_period, prev_day_idx)), "cell")
+            self._set_cell_role(
+                self.cell_widgets.get((self.current_period, self.current_day_idx)), "current"
+            )
+
+        # 현재 교시가 변경되었으면 알림
         if prev_period != self.current_period:
-            self.update_styles()
-            
             # 알림 관리자에 상태 전달
             self.notification_manager.check_notifications(
                 self.current_period, 
@@ -420,12 +569,22 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         # 너무 긴 대기 시간은 최대 10분으로 제한 (안전장치)
         next_update_msec = min(next_update_msec, 600000)  
         
-        # 타이머 재설정
+        # 타이머 재설정 (단발성: timeout 시 update_current_period가 다시 예약)
+        # 임박한 전환만 정밀 타이머를 쓰고, 긴 대기일수록 거친 타이머로
+        # OS가 wakeup을 병합(절전)할 수 있게 둔다
+        if next_update_msec < 5000:
+            timer_type = QtCore.Qt.PreciseTimer
+        elif next_update_msec > 30000:
+            timer_type = QtCore.Qt.VeryCoarseTimer  # ±수백 ms 오차 허용
+        else:
+            timer_type = QtCore.Qt.CoarseTimer
         self.timer.stop()
+        self.timer.setTimerType(timer_type)
         self.timer.setInterval(max(1000, next_update_msec))  # 최소 1초
         self.timer.start()
         
-        logger.debug(f"다음 업데이트 예약: {next_update_msec/1000:.1f}초 후")
+        # 지연 포맷: 타이머 핫 경로에서 DEBUG 비활성 시 포맷 생략
+        logger.debug("다음 업데이트 예약: %.1f초 후", next_update_msec / 1000)
     
     def mousePressEvent(self, event):
         """마우스 클릭 이벤트 처리"""
@@ -442,52 +601,82 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
         self.handle_mouse_release(event)
         super().mouseReleaseEvent(event)
     
-    def show_context_menu(self, pos):
-        """마우스 우클릭 메뉴 표시"""
+    def _build_context_menu(self):
+        """우클릭 메뉴 최초 1회 구성 (이후 show_context_menu에서 재사용)"""
         menu = QtWidgets.QMenu(self)
-        
+
         edit_action = menu.addAction("시간표 편집")
         edit_action.triggered.connect(self.show_timetable_edit_dialog)
-        
+
         time_action = menu.addAction("시간 설정")
         time_action.triggered.connect(self.show_time_dialog)
-        
+
         settings_action = menu.addAction("설정")
         settings_action.triggered.connect(self.show_settings_dialog)
-        
-        # 위치 고정 토글 메뉴 추가
+
+        # 위치 고정 토글 메뉴 추가 (표시 직전에 체크 상태만 갱신)
         lock_action = menu.addAction("위치 고정")
         lock_action.setCheckable(True)
-        lock_action.setChecked(self.settings_manager.is_position_locked)
         lock_action.triggered.connect(self.toggle_position_lock)
-        
+        self._lock_action = lock_action
+
         # 새 기능: QR코드 공유 메뉴 추가
         menu.addSeparator()
         sharing_menu = menu.addMenu("공유 및 백업")
-        
+
         qr_share_action = sharing_menu.addAction("QR코드로 공유")
         qr_share_action.triggered.connect(self.show_qr_share_dialog)
-        
+
         import_action = sharing_menu.addAction("QR코드/파일에서 가져오기")
         import_action.triggered.connect(self.show_import_dialog)
-        
+
         backup_action = sharing_menu.addAction("백업/복원")
         backup_action.triggered.connect(self.show_backup_dialog)
-        
+
         menu.addSeparator()
-        
+
         exit_action = menu.addAction("종료")
         exit_action.triggered.connect(self.close)
-        
-        # 메뉴 표시
-        menu.exec_(self.mapToGlobal(pos))
+
+        return menu
+
+    def show_context_menu(self, pos):
+        """마우스 우클릭 메뉴 표시 (메뉴는 최초 1회만 구성)"""
+        if self._context_menu is None:
+            self._context_menu = self._build_context_menu()
+        # 재사용 시 바뀔 수 있는 상태만 갱신
+        self._lock_action.setChecked(self.settings_manager.is_position_locked)
+        self._context_menu.exec_(self.mapToGlobal(pos))
+
+    @classmethod
+    def _get_qr_dialog_class(cls):
+        """QRShareDialog 클래스를 최초 1회만 임포트하고 캐시"""
+        if cls._QRShareDialog is None:
+            from .dialogs.qr_share_dialog import QRShareDialog
+            cls._QRShareDialog = QRShareDialog
+        return cls._QRShareDialog
+
+    @classmethod
+    def _get_import_dialog_class(cls):
+        """ImportDialog 클래스를 최초 1회만 임포트하고 캐시"""
+        if cls._ImportDialog is None:
+            from .dialogs.import_dialog import ImportDialog
+            cls._ImportDialog = ImportDialog
+        return cls._ImportDialog
+
+    @classmethod
+    def _get_backup_dialog_class(cls):
+        """BackupRestoreDialog 클래스를 최초 1회만 임포트하고 캐시"""
+        if cls._BackupRestoreDialog is None:
+            from .dialogs.backup_dialog import BackupRestoreDialog
+            cls._BackupRestoreDialog = BackupRestoreDialog
+        return cls._BackupRestoreDialog
 
     # 새 메서드 추가
     def show_qr_share_dialog(self):
         """QR 코드 공유 대화상자 표시"""
         try:
-            from .dialogs.qr_share_dialog import QRShareDialog
-            dialog = QRShareDialog(self)
+            dialog = self._get_qr_dialog_class()(self)
             dialog.exec_()
         except ImportError as e:
             QtWidgets.QMessageBox.warning(
@@ -499,8 +688,7 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
     def show_import_dialog(self):
         """데이터 가져오기 대화상자 표시"""
         try:
-            from .dialogs.import_dialog import ImportDialog
-            dialog = ImportDialog(self)
+            dialog = self._get_import_dialog_class()(self)
             dialog.exec_()
         except ImportError as e:
             QtWidgets.QMessageBox.warning(
@@ -511,8 +699,7 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
 
     def show_backup_dialog(self):
         """백업 관리 대화상자 표시"""
-        from .dialogs.backup_dialog import BackupRestoreDialog
-        dialog = BackupRestoreDialog(self)
+        dialog = self._get_backup_dialog_class()(self)
         dialog.exec_()
 
     def toggle_position_lock(self):
@@ -533,11 +720,18 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
             self.update_current_period()  # 현재 교시 업데이트
     
     def show_settings_dialog(self):
-        """설정 대화상자 표시"""
-        dialog = SettingsDialog(self)
-        # SettingsDialog의 settings_applied 시그널을 Widget의 update_styles 메서드에 연결
-        dialog.settings_applied.connect(self.update_styles)
-        
+        """설정 대화상자 표시 (인스턴스는 최초 1회만 생성하고 이후 재사용)"""
+        if self._settings_dialog is None:
+            dialog = SettingsDialog(self)
+            # SettingsDialog의 settings_applied 시그널을 Widget의 update_styles 메서드에 연결
+            dialog.settings_applied.connect(self.update_styles)
+            self._settings_dialog = dialog
+        else:
+            dialog = self._settings_dialog
+            # 재사용 시 취소용 백업과 컨트롤을 현재 설정값으로 다시 동기화
+            dialog._backup_initial_settings()
+            dialog.update_controls_from_settings()
+
         # dialog.exec_()는 사용자가 대화상자를 닫을 때까지 블로킹합니다.
         # "확인" 또는 "적용" 후 "취소"가 아닌 방식으로 닫히면 Accepted 반환.
         # "적용" 버튼을 누르면 apply_settings가 호출되고 settings_applied 시그널이 발생하여
@@ -572,6 +766,25 @@ class Widget(DragResizeMixin, QtWidgets.QWidget):
             event.accept()
         # super().closeEvent(event) # event.accept() 또는 event.ignore()로 대체됨
 
+    def eventFilter(self, obj, event):
+        """그리드 라벨의 호버 이벤트를 단일 필터로 분기 처리
+
+        라벨 48개에 enterEvent/leaveEvent 람다를 몽키패치하는 대신
+        하나의 필터에서 라벨 종류별 핸들러로 디스패치한다.
+        """
+        event_type = event.type()
+        if event_type == QtCore.QEvent.Enter:
+            if obj in self._cell_label_set:
+                self.on_cell_hover_enter(event, obj)
+            elif obj in self._header_label_set:
+                self.on_label_hover_enter(event, obj)
+        elif event_type == QtCore.QEvent.Leave:
+            if obj in self._cell_label_set:
+                self.on_cell_hover_leave(event, obj)
+            elif obj in self._header_label_set:
+                self.on_label_hover_leave(event, obj)
+        return super().eventFilter(obj, event)
+
     # 호버 이벤트 처리 메서드 추가
     def on_label_hover_enter(self, event, label):
         """라벨에 마우스가 올라갔을 때 호출"""
@@ -1,16 +1,19 @@
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 import os
+import re
+import json
 import shutil
 import atexit
 import traceback
-import multiprocessing
 import signal
-import psutil
+import weakref
 import threading
-import requests
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import QTimer, pyqtSignal, QObject, Qt
+from PyQt5.QtCore import QTimer, pyqtSignal, QObject, Qt, QRunnable, QThreadPool
 
 # 버전 정보 가져오기
 from utils.version import get_version, get_version_string
@@ -28,14 +31,33 @@ from utils.auto_start import enable_auto_start, disable_auto_start
 # 정리 작업이 완료되었는지 추적하는 플래그
 _cleanup_done = False
 
-# Windows 환경에서 사용할 추가 모듈
-try:
-    import win32api
-    import win32con
-    import win32process
-    WINDOWS_MODULES_AVAILABLE = True
-except ImportError:
-    WINDOWS_MODULES_AVAILABLE = False
+# psutil/multiprocessing/win32 모듈은 임포트 자체가 무겁고(서브모듈 수십 개,
+# DLL 로드) 종료 경로에서만 필요하므로 최초 사용 시점에 지연 임포트한다
+_psutil = None
+_win32api = None
+_win32_checked = False
+
+def _get_psutil():
+    """psutil 모듈을 최초 1회만 임포트하고 캐시"""
+    global _psutil
+    if _psutil is None:
+        import psutil
+        _psutil = psutil
+    return _psutil
+
+def _get_win32api():
+    """win32api 모듈을 최초 1회만 임포트하고 캐시 (없으면 None)"""
+    global _win32api, _win32_checked
+    if not _win32_checked:
+        _win32_checked = True
+        # POSIX에서는 어차피 실패할 임포트 시도(ImportError 생성 포함)를 생략
+        if sys.platform == 'win32':
+            try:
+                import win32api
+                _win32api = win32api
+            except ImportError:
+                _win32api = None
+    return _win32api
 
 # 로거 설정
 def setup_logging():
@@ -47,23 +69,41 @@ def setup_logging():
     # 로그 파일명 (예: SchoolTimetableWidget.log)
     log_file_name = f"{APP_NAME}.log"
     log_file_path = os.path.join(log_dir_path, log_file_name)
-    
+
+    # 파일/콘솔 쓰기는 QueueListener 스레드에서 수행한다. emit 호출부는
+    # 큐에 레코드만 넣고 즉시 반환하므로 GUI 스레드가 디스크 fsync나
+    # 느린 콘솔 출력에 막히지 않는다 (MemoryHandler 버퍼링 방식을 대체)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    # 종료 시 큐에 남은 레코드를 모두 기록하고 리스너 스레드를 정리
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file_path, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     return logging.getLogger("SchoolTimetable")
 
 logger = setup_logging()
 
+# 데이터 디렉토리는 모듈 로드 시 한 번만 계산해 공유
+# (setup_logging과 setup_environment가 각각 appdirs 조회 + stat을 반복하지 않도록)
+DATA_DIR = ensure_data_directory_exists()
+
 def force_terminate_process(pid):
     """프로세스를 강제로 종료 (Windows 환경에 최적화)"""
     try:
-        if WINDOWS_MODULES_AVAILABLE:
+        win32api = _get_win32api()
+        if win32api:
             PROCESS_TERMINATE = 1
             handle = win32api.OpenProcess(PROCESS_TERMINATE, False, pid)
             if handle:
@@ -71,84 +111,252 @@ def force_terminate_process(pid):
                 win32api.CloseHandle(handle)
                 logger.info(f"Windows API로 프로세스 종료: {pid}")
                 return True
-        # 일반적인 방식으로 프로세스 종료 시도
-        process = psutil.Process(pid)
-        process.kill()
+        # 일반적인 방식: psutil.Process 생성(프로세스 핸들 재오픈 + 객체 할당)
+        # 없이 시그널을 바로 전송
+        os.kill(pid, signal.SIGKILL if hasattr(signal, 'SIGKILL') else signal.SIGTERM)
         return True
     except Exception as e:
         logger.error(f"프로세스 {pid} 종료 실패: {str(e)}")
         return False
 
-def kill_all_threads():
-    """모든 non-daemon 스레드 종료 시도"""
-    main_thread = threading.main_thread()
-    for thread in threading.enumerate():
-        if thread is not main_thread and thread.is_alive():
-            logger.info(f"스레드 종료 시도: {thread.name}")
-            # 강제 종료는 불가, 데몬 스레드는 메인 종료 시 같이 종료됨
-            pass
+@functools.lru_cache(maxsize=1)
+def _resolve_icon_path():
+    """자동 시작 바로가기용 아이콘 경로를 1회만 탐색해 캐시
+
+    resource_path + exists 조합은 frozen 빌드에서 _MEIPASS 탐색과
+    stat 호출을 동반하므로, 결과가 바뀌지 않는 탐색을 반복하지 않는다.
+    """
+    from utils.auto_start import get_executable_path
+    for name in ("assets/app_icon.ico", "assets/icon.ico"):
+        path = resource_path(name)
+        if os.path.exists(path):
+            return path
+    # 아이콘 파일이 아예 없는 경우 실행 파일 자체 아이콘 사용
+    return get_executable_path()
 
 GITHUB_REPO = "chuthulhu/school-timetable-widget"
 GITHUB_API_RELEASES = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 
+# 버전 문자열 파싱용 패턴 (비교 호출마다 re 임포트/컴파일하지 않도록 모듈 수준)
+_VERSION_NUM_RE = re.compile(r'\d+')
+
 class Updater:
     def __init__(self, current_version):
         self.current_version = current_version
+        # 현재 버전은 인스턴스 수명 동안 불변이므로 한 번만 파싱해 둔다
+        self._current_parsed = self.parse_version(current_version)
         self.latest_version = None
         self.download_url = None
         self.release_notes = None
+        self._cache_path = os.path.join(DATA_DIR, "update_check_cache.json")
+        self._session = None
+
+    def _get_session(self):
+        """재시도 정책이 설정된 requests.Session을 최초 1회만 생성
+
+        확인과 다운로드가 같은 호스트로 나가므로 세션을 공유하면
+        커넥션 풀 재사용으로 TLS 핸드셰이크를 반복하지 않는다.
+        """
+        if self._session is None:
+            # requests는 무거운 임포트라 최초 사용 시점(워커 스레드)으로 지연
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            session = requests.Session()
+            adapter = HTTPAdapter(max_retries=Retry(
+                total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers["User-Agent"] = f"school-timetable-widget/{self.current_version}"
+            self._session = session
+        return self._session
+
+    def _load_release_cache(self):
+        """이전 조회에서 저장한 ETag와 릴리즈 정보 로드"""
+        try:
+            if os.path.exists(self._cache_path):
+                with open(self._cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.debug("업데이트 캐시 로드 실패: %s", e)
+        return {}
+
+    def _save_release_cache(self, etag):
+        """조회 결과를 ETag와 함께 저장 (다음 조회의 조건부 요청에 사용)"""
+        try:
+            with open(self._cache_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "etag": etag,
+                    "tag_name": self.latest_version,
+                    "download_url": self.download_url,
+                    "release_notes": self.release_notes,
+                }, f, ensure_ascii=False)
+        except Exception as e:
+            logger.debug("업데이트 캐시 저장 실패: %s", e)
 
     def check_for_update(self):
         try:
-            resp = requests.get(GITHUB_API_RELEASES, timeout=5)
-            if resp.status_code == 200:
+            # 조건부 요청: 릴리즈가 그대로면 GitHub이 304로 응답해
+            # JSON 본문 전송과 파싱을 모두 생략할 수 있다
+            cache = self._load_release_cache()
+            headers = {}
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            resp = self._get_session().get(GITHUB_API_RELEASES, timeout=5, headers=headers)
+            if resp.status_code == 304:
+                self.latest_version = cache.get("tag_name")
+                self.download_url = cache.get("download_url")
+                self.release_notes = cache.get("release_notes", "")
+            elif resp.status_code == 200:
                 data = resp.json()
                 self.latest_version = data.get("tag_name")
                 self.release_notes = data.get("body", "")
-                for asset in data.get("assets", []):
-                    if asset["name"].endswith(".exe"):
-                        self.download_url = asset["browser_download_url"]
-                        break
-                if self.latest_version and self.download_url:
-                    return self.is_newer_version(self.latest_version, self.current_version)
+                exe_asset = next(
+                    (a for a in data.get("assets", ()) if a["name"].endswith(".exe")),
+                    None,
+                )
+                if exe_asset:
+                    self.download_url = exe_asset["browser_download_url"]
+                self._save_release_cache(resp.headers.get("ETag"))
             else:
                 logger.warning(f"GitHub 릴리즈 정보 조회 실패: {resp.status_code}")
+            if self.latest_version and self.download_url:
+                return self.is_newer_version(self.latest_version)
         except Exception as e:
             logger.warning(f"업데이트 확인 중 오류: {e}")
         return False
 
     @staticmethod
-    def is_newer_version(latest, current):
-        import re
-        def parse(v):
-            return [int(x) for x in re.findall(r'\d+', v)]
-        return parse(latest) > parse(current)
+    def parse_version(v):
+        """버전 문자열을 비교 가능한 객체로 파싱
+
+        packaging이 있으면 PEP 440 규칙(프리릴리즈 등)을 따르고,
+        없으면 기존과 동일한 숫자 리스트 비교로 동작한다.
+        """
+        stripped = v.lstrip('vV')
+        try:
+            from packaging.version import Version, InvalidVersion
+            try:
+                return Version(stripped)
+            except InvalidVersion:
+                pass
+        except ImportError:
+            pass
+        return [int(x) for x in _VERSION_NUM_RE.findall(v)]
+
+    def is_newer_version(self, latest, current=None):
+        latest_parsed = self.parse_version(latest)
+        current_parsed = self._current_parsed if current is None \
+            else self.parse_version(current)
+        try:
+            return latest_parsed > current_parsed
+        except TypeError:
+            # packaging 유무에 따라 타입이 갈린 경우 숫자 리스트로 통일해 비교
+            return ([int(x) for x in _VERSION_NUM_RE.findall(latest)]
+                    > [int(x) for x in _VERSION_NUM_RE.findall(current or self.current_version)])
 
     def download_update(self, dest_path, progress_callback=None):
         try:
-            with requests.get(self.download_url, stream=True, timeout=30) as r:
+            with self._get_session().get(self.download_url, stream=True, timeout=30) as r:
                 r.raise_for_status()
                 total = int(r.headers.get('content-length', 0))
                 with open(dest_path, 'wb') as f:
-                    downloaded = 0
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if progress_callback and total:
+                    if not (progress_callback and total):
+                        # 진행률이 필요 없으면 소켓→파일로 큰 버퍼 단위 복사
+                        # (8KB 청크 루프의 파이썬 레벨 반복을 모두 생략)
+                        r.raw.decode_content = True
+                        shutil.copyfileobj(r.raw, f, length=1 << 20)
+                    else:
+                        # 진행률 보고 시에도 256KB 청크면 수 MB 파일 기준
+                        # 루프 횟수가 기존 8KB 대비 1/32로 줄어든다
+                        downloaded = 0
+                        for chunk in r.iter_content(chunk_size=262144):
+                            if chunk:
+                                f.write(chunk)
+                                downloaded += len(chunk)
                                 progress_callback(downloaded, total)
             return True
         except Exception as e:
             logger.error(f"업데이트 다운로드 실패: {e}")
             return False
 
+class UpdateCheckWorker(QRunnable):
+    """백그라운드 스레드에서 업데이트 확인을 수행하는 워커
+
+    check_for_update는 GitHub API 왕복으로 최대 5초 블로킹될 수 있으므로
+    메인 스레드 대신 QThreadPool에서 돌리고 결과만 시그널로 알린다.
+    """
+
+    class Signals(QObject):
+        done = pyqtSignal(object, bool)  # (updater, 새 버전 존재 여부)
+
+    def __init__(self, updater):
+        super().__init__()
+        self.updater = updater
+        self.signals = UpdateCheckWorker.Signals()
+
+    def run(self):
+        has_update = False
+        try:
+            has_update = self.updater.check_for_update()
+        except Exception as e:
+            logger.warning(f"업데이트 확인 중 오류: {e}")
+        self.signals.done.emit(self.updater, has_update)
+
+
+class UpdateDownloadWorker(QRunnable):
+    """백그라운드 스레드에서 업데이트 파일을 내려받는 워커"""
+
+    class Signals(QObject):
+        progress = pyqtSignal(int, int)  # (받은 바이트, 전체 바이트)
+        finished = pyqtSignal(bool, str)  # (성공 여부, 저장 경로)
+
+    def __init__(self, updater, dest_path):
+        super().__init__()
+        self.updater = updater
+        self.dest_path = dest_path
+        self.signals = UpdateDownloadWorker.Signals()
+
+    def run(self):
+        # 청크마다 시그널을 보내면 메인 스레드에 큐잉 이벤트가 수백 개
+        # 쌓이므로, 표시 단위(정수 %)가 실제로 바뀔 때만 emit한다
+        last_pct = -1
+
+        def _report(done, total):
+            nonlocal last_pct
+            pct = done * 100 // total
+            if pct != last_pct:
+                last_pct = pct
+                self.signals.progress.emit(done, total)
+
+        ok = self.updater.download_update(self.dest_path, progress_callback=_report)
+        self.signals.finished.emit(ok, self.dest_path)
+
+
 class ApplicationManager:
     def __init__(self):
         self._cleanup_done = False
+        self._cleanup_lock = threading.Lock()
+        self._shutdown_requested = False
         self.app = None
         self.widget = None
         self.tray_icon = None
+        # 종료 시 중지할 QTimer 레지스트리 (약한 참조라 소멸된 타이머는 자동 제거)
+        self._registered_timers = weakref.WeakSet()
+        # 업데이트 워커는 실행 중 GC되지 않도록 인스턴스에 보관
+        self._update_check_worker = None
+        self._update_download_worker = None
+        self._update_progress = None
         self.setup_environment()
+
+    def register_timer(self, timer):
+        """종료 시 중지해야 할 QTimer 등록
+
+        stop_timers가 findChildren(QTimer)로 QObject 트리 전체를
+        훑지 않도록, 타이머를 만드는 쪽에서 명시적으로 등록한다.
+        """
+        self._registered_timers.add(timer)
         
     def setup_environment(self):
         """실행 환경 설정"""
@@ -156,7 +364,7 @@ class ApplicationManager:
             "app_name": "학교 시간표 위젯",
             "app_version": get_version(),
             "app_version_string": get_version_string(),
-            "data_dir": ensure_data_directory_exists()
+            "data_dir": DATA_DIR  # 모듈 로드 시 1회 계산된 경로 재사용
         }
         
         # 환경 변수 설정
@@ -172,15 +380,17 @@ class ApplicationManager:
         return config
     
     def copy_default_resources(self, data_dir):
-        """기본 리소스 파일 복사"""
+        """기본 리소스 파일 복사 (첫 실행 시에만)"""
         try:
             csv_path = os.path.join(data_dir, 'default_timetable.csv')
-            if not os.path.exists(csv_path) and getattr(sys, 'frozen', False):
-                default_csv = resource_path(os.path.join('assets', 'default_timetable.csv'))
-                if (os.path.exists(default_csv)):
-                    shutil.copy(default_csv, csv_path)
-                else:
-                    logger.error(f"기본 시간표 파일을 찾을 수 없습니다: {default_csv}")
+            # resource_path(frozen 빌드에서는 sys._MEIPASS 탐색)를 타기 전에 단락
+            if os.path.exists(csv_path) or not getattr(sys, 'frozen', False):
+                return
+            default_csv = resource_path(os.path.join('assets', 'default_timetable.csv'))
+            if os.path.exists(default_csv):
+                shutil.copy(default_csv, csv_path)
+            else:
+                logger.error(f"기본 시간표 파일을 찾을 수 없습니다: {default_csv}")
         except Exception as e:
             logger.error(f"리소스 복사 중 오류 발생: {e}")
         
@@ -189,141 +399,160 @@ class ApplicationManager:
         signal.signal(signal.SIGTERM, self.signal_handler)
         if hasattr(signal, 'SIGBREAK'):
             signal.signal(signal.SIGBREAK, self.signal_handler)
+
+    def install_signal_wakeup(self):
+        """시그널 수신 시 Qt 이벤트 루프를 즉시 깨우는 소켓 연동 설치
+
+        파이썬 수준 시그널 핸들러는 인터프리터가 바이트코드를 실행해야
+        돌아가는데, Qt 이벤트 루프가 C 쪽에서 대기 중이면 다음 타이머/
+        이벤트까지 핸들러 실행이 밀린다. set_wakeup_fd로 시그널 도착 시
+        소켓에 1바이트가 쓰이게 하고 QSocketNotifier가 그 소켓을 감시해
+        루프를 깨우면, 주기적 타이머 폴링 없이도 Ctrl+C가 즉시 반영된다.
+        """
+        import socket
+        from PyQt5.QtCore import QSocketNotifier
+        self._wakeup_write, self._wakeup_read = socket.socketpair()
+        self._wakeup_write.setblocking(False)
+        self._wakeup_read.setblocking(False)
+        signal.set_wakeup_fd(self._wakeup_write.fileno())
+        self._wakeup_notifier = QSocketNotifier(
+            self._wakeup_read.fileno(), QSocketNotifier.Read, self.app
+        )
+        self._wakeup_notifier.activated.connect(self._drain_signal_wakeup)
+
+    def _drain_signal_wakeup(self):
+        """wakeup 소켓 비우기 — 실제 종료 처리는 signal_handler가 담당"""
+        try:
+            self._wakeup_read.recv(64)
+        except OSError:
+            pass
             
     def signal_handler(self, signum, frame):
+        """시그널 수신 시 이벤트 루프 종료만 요청하고 실제 정리는 지연
+
+        시그널 프레임 안에서 psutil 열거 같은 무거운 작업을 직접 하면
+        바이트코드 사이에 끼어든 상태에서 재진입 위험이 있다.
+        quit() 요청만 하고 정리는 aboutToQuit → cleanup_resources에 맡긴다.
+        """
         logger.info(f"시그널 {signum} 수신: 애플리케이션을 종료합니다.")
-        self.cleanup_resources()
-        sys.exit(0)
+        self._shutdown_requested = True
+        app = QApplication.instance()
+        if app:
+            app.quit()
+        else:
+            # 이벤트 루프가 아직 없으면 기존처럼 즉시 정리 후 종료
+            self.cleanup_resources()
+            sys.exit(0)
         
     def cleanup_resources(self):
         """애플리케이션 종료 시 모든 리소스 정리"""
-        if self._cleanup_done:
-            logger.info("정리 작업이 이미 완료되었습니다.")
-            return
-        
+        # aboutToQuit, atexit, 시그널 경로에서 겹쳐 들어올 수 있으므로
+        # 락으로 플래그 검사-설정만 감싸 첫 진입만 통과시키고 즉시 반환한다
+        # (본문 실행 중 예외가 나도 락이 잡힌 채 남지 않음)
+        with self._cleanup_lock:
+            if self._cleanup_done:
+                logger.info("정리 작업이 이미 완료되었거나 진행 중입니다.")
+                return
+            self._cleanup_done = True
+
         logger.info("리소스 정리 시작...")
-        
+
+        # 종료 시퀀스 중 생성되는 단명 객체(로그 문자열, 예외)가
+        # 비자발적 전체 GC를 유발하지 않도록 순환 GC를 끈다
+        # (직후 프로세스가 종료되므로 다시 켤 필요 없음)
+        import gc
+        gc.disable()
+
         # 모든 QTimer 중지 시도
         try:
             self.stop_timers()
         except:
             logger.error("QTimer 중지 중 오류 발생")
         
-        # 모든 스레드 종료 시도
-        try:
-            kill_all_threads()
-        except Exception as e:
-            logger.error(f"스레드 종료 중 오류: {str(e)}")
-        
-        # 현재 프로세스의 모든 자식 프로세스 종료
+        # 백그라운드 작업은 전부 QThreadPool 워커(데몬 성격)로 돌아가므로
+        # 종료 시 join 대기가 필요 없다. 혹시 남아 있는 non-daemon 스레드는
+        # 버그 신호이므로 개수만 기록해 둔다.
+        non_daemon = sum(
+            1 for t in threading.enumerate()
+            if t is not threading.main_thread() and not t.daemon and t.is_alive()
+        )
+        if non_daemon:
+            logger.warning("종료 시점에 non-daemon 스레드 %d개가 남아 있습니다.", non_daemon)
+
+        # 자식 프로세스 정리: psutil 트리와 multiprocessing 자식을 PID로 합쳐
+        # 한 번만 열거/terminate하고 집단 대기 1회로 마무리
+        # (이전에는 같은 PID에 세 번의 열거와 중복 terminate/join이 발생)
         try:
-            current_pid = os.getpid()
-            current_process = psutil.Process(current_pid)
-            children = current_process.children(recursive=True)
-            logger.info(f"종료할 자식 프로세스 수: {len(children)}")
-            for idx, child in enumerate(children):
-                try:
-                    logger.info(f"프로세스 종료 시도 {idx+1}/{len(children)}: PID {child.pid}, 이름: {child.name()}")
-                    child.terminate()
-                except Exception as e:
-                    logger.error(f"프로세스 종료 중 오류 (PID {child.pid}): {str(e)}")
-            gone, alive = psutil.wait_procs(children, timeout=1)
-            logger.info(f"정상 종료된 프로세스: {len(gone)}, 강제 종료 필요한 프로세스: {len(alive)}")
-            for child in alive:
-                try:
-                    logger.info(f"프로세스 강제 종료 (PID {child.pid}): {child.name()}")
-                    force_terminate_process(child.pid)
-                except Exception as e:
-                    logger.error(f"프로세스 강제 종료 중 오류 (PID {child.pid}): {str(e)}")
+            import multiprocessing
+            psutil = _get_psutil()
+            targets = {
+                p.pid: p
+                for p in psutil.Process(os.getpid()).children(recursive=True)
+            }
+            for child in multiprocessing.active_children():
+                if child.pid is not None and child.pid not in targets:
+                    try:
+                        targets[child.pid] = psutil.Process(child.pid)
+                    except psutil.NoSuchProcess:
+                        continue
+            self._terminate_tree(list(targets.values()))
         except Exception as e:
             logger.error(f"프로세스 정리 중 예외 발생: {str(e)}")
-        
-        # multiprocessing 모듈의 자식 프로세스 정리
-        try:
-            active_children = multiprocessing.active_children()
-            logger.info(f"활성 multiprocessing 자식 프로세스: {len(active_children)}")
-            for child in active_children:
-                logger.info(f"multiprocessing 자식 종료: {child.name} (PID: {child.pid})")
-                child.terminate()
-                child.join(0.5)
-        except Exception as e:
-            logger.error(f"multiprocessing 정리 중 오류: {str(e)}")
-        
-        # Windows에서 추가로 필요한 프로세스 정리
-        if hasattr(multiprocessing, 'process'):
-            try:
-                mp_children = list(multiprocessing.process._children)
-                logger.info(f"남은 multiprocessing 프로세스: {len(mp_children)}")
-                for p in mp_children:
-                    if p.is_alive():
-                        logger.info(f"추가 프로세스 종료: {p.name}")
-                        p.terminate()
-                        p.join(0.5)
-            except Exception as e:
-                logger.error(f"추가 프로세스 정리 중 오류: {str(e)}")
-        
-        # 관련 파이썬 프로세스 강제 종료 (최후의 수단) - 현재 비활성화 (위험성 때문)
-        # try:
-        #     self.force_kill_python_processes()
-        # except Exception as e:
-        #     logger.error(f"파이썬 프로세스 강제 종료 중 오류: {str(e)}")
-        
-        # 메모리 정리 시도
-        try:
-            import gc
-            gc.collect()
-        except:
-            pass
-        
+
+        # 수동 gc.collect()는 하지 않음: 곧바로 프로세스가 종료되므로
+        # 전체 힙 순회만 하고 이득이 없다 (참조 카운트 + OS 회수로 충분)
+
         logger.info("모든 리소스 정리 완료")
-        self._cleanup_done = True
-    
-    def force_kill_python_processes(self):
-        current_pid = os.getpid()
-        logger.info(f"현재 프로세스 ID: {current_pid}")
-        killed = 0
-        try:
-            for proc in psutil.process_iter(['pid', 'name', 'username', 'cmdline']):
-                try:
-                    pid = proc.pid
-                    if pid == current_pid:
-                        continue
-                    try:
-                        proc_name = proc.name().lower()
-                    except:
-                        proc_name = ""
-                    try:
-                        cmdline = proc.cmdline()
-                    except:
-                        cmdline = []
-                    is_python = False
-                    if cmdline:
-                        is_python = any('python' in cmd.lower() for cmd in cmdline if cmd)
-                    if proc_name in ('python.exe', 'pythonw.exe'):
-                        is_python = True
-                    if is_python:
-                        logger.info(f"Python 프로세스 발견: PID {pid}, 명령어: {' '.join(cmdline[:2] if cmdline else [])}")
-                        if force_terminate_process(pid):
-                            killed += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
-                    logger.debug(f"프로세스 정보 접근 오류: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"예상치 못한 오류: {e}")
-                    continue
-        except Exception as e:
-            logger.error(f"프로세스 종료 중 오류 발생: {e}")
-        logger.info(f"총 {killed}개의 Python 프로세스를 강제 종료했습니다.")
-        return killed
     
-    def stop_timers(self):
-        if not self.app:
+    def _terminate_tree(self, procs, grace=0.2, kill_grace=0.2):
+        """자식 프로세스 목록을 단계적으로 종료
+
+        terminate → grace초 집단 대기 → 생존자 kill → kill_grace초 대기.
+        wait_procs가 전체를 한 번에 폴링하므로 프로세스별 join 직렬화가 없다.
+        """
+        if not procs:
+            logger.info("종료할 자식 프로세스 없음")
             return
-        for obj in self.app.findChildren(QTimer):
+        psutil = _get_psutil()
+        logger.info(f"종료할 자식 프로세스 수: {len(procs)}")
+
+        def _safe_terminate(proc):
             try:
-                if obj.isActive():
-                    obj.stop()
-                    logger.debug(f"QTimer 중지: {obj}")
+                proc.terminate()
+            except psutil.NoSuchProcess:
+                # 이미 사라진 프로세스는 예상된 결과 — 로그/문자열 생성 생략
+                pass
+            except Exception as e:
+                logger.error(f"프로세스 종료 중 오류 (PID {proc.pid}): {str(e)}")
+
+        # 시그널 전송은 syscall 바운드(GIL 해제)이므로 스레드 풀로
+        # 겹쳐 보내 O(N) 왕복 직렬화를 피한다
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(16, len(procs))) as ex:
+            list(ex.map(_safe_terminate, procs))
+
+        gone, alive = psutil.wait_procs(
+            procs, timeout=grace,
+            callback=lambda p: logger.debug("프로세스 정상 종료: PID %s", p.pid),
+        )
+        logger.info(f"정상 종료된 프로세스: {len(gone)}, 강제 종료 필요한 프로세스: {len(alive)}")
+        if not alive:
+            return
+        for proc in alive:
+            try:
+                force_terminate_process(proc.pid)
+            except psutil.NoSuchProcess:
+                continue
+            except Exception as e:
+                logger.error(f"프로세스 강제 종료 중 오류 (PID {proc.pid}): {str(e)}")
+        psutil.wait_procs(alive, timeout=kill_grace)
+
+    def stop_timers(self):
+        """등록된 QTimer만 중지 (QObject 트리 전체 탐색 없이)"""
+        for obj in list(self._registered_timers):
+            try:
+                # stop()은 비활성 타이머에도 안전하므로 isActive() 왕복 생략
+                obj.stop()
             except Exception as e:
                 logger.error(f"타이머 중지 중 오류: {e}")
     
@@ -335,6 +564,7 @@ class ApplicationManager:
             self.app.setQuitOnLastWindowClosed(False)
             self.app.setApplicationName("학교 시간표 위젯")
             self.app.aboutToQuit.connect(self.cleanup_resources)
+            self.install_signal_wakeup()
             self.settings_manager = SettingsManager.get_instance() # self.settings_manager로 할당
             self.notification_manager = NotificationManager.get_instance() # self.notification_manager로 할당
             
@@ -355,6 +585,9 @@ class ApplicationManager:
                 from PyQt5.QtGui import QIcon
                 self.tray_icon.setIcon(QIcon(resource_path(os.path.join('assets', 'app_icon.ico'))))
             self.tray_icon.show()
+            # 업데이트 확인은 이벤트 루프 진입 후 백그라운드에서 수행
+            # (기동 경로에서 네트워크 왕복으로 최대 5초 블로킹되던 것 제거)
+            self._start_update_check()
             exit_code = self.app.exec_()
             logger.info(f"앱 종료됨 (코드: {exit_code}), 리소스 정리 시작")
             self.cleanup_resources()
@@ -364,6 +597,65 @@ class ApplicationManager:
             self.cleanup_resources()
             return 1
     
+    def _start_update_check(self):
+        """백그라운드 스레드 풀에서 업데이트 확인 시작"""
+        self._update_check_worker = UpdateCheckWorker(Updater(get_version()))
+        # 워커 스레드에서의 emit은 자동 연결로 메인 스레드에 큐잉되어 전달됨
+        self._update_check_worker.signals.done.connect(self._on_update_check_done)
+        QThreadPool.globalInstance().start(self._update_check_worker)
+
+    def _on_update_check_done(self, updater, has_update):
+        """업데이트 확인 결과 처리 (메인 스레드에서 호출됨)"""
+        if not has_update:
+            return
+        msg = (f"새 버전({updater.latest_version})이 출시되었습니다!\n\n"
+               f"릴리즈 노트:\n{updater.release_notes}\n\n지금 다운로드하시겠습니까?")
+        reply = QMessageBox.question(None, "업데이트 알림", msg,
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply == QMessageBox.Yes:
+            self._download_update(updater)
+
+    def _download_update(self, updater):
+        """업데이트 파일 다운로드를 백그라운드로 시작하고 진행률 표시"""
+        import tempfile
+        from PyQt5.QtWidgets import QProgressDialog
+
+        dest = os.path.join(
+            tempfile.gettempdir(),
+            f"school_timetable_update_{updater.latest_version}.exe"
+        )
+        self._update_progress = QProgressDialog("업데이트 다운로드 중...", None, 0, 100)
+        self._update_progress.setWindowTitle("업데이트")
+        self._update_progress.setWindowModality(Qt.ApplicationModal)
+
+        self._update_download_worker = UpdateDownloadWorker(updater, dest)
+        self._update_download_worker.signals.progress.connect(
+            lambda done, total: self._update_progress.setValue(
+                int(done / total * 100)) if total else None
+        )
+        self._update_download_worker.signals.finished.connect(
+            self._on_update_download_done
+        )
+        QThreadPool.globalInstance().start(self._update_download_worker)
+        self._update_progress.show()
+
+    def _on_update_download_done(self, ok, dest):
+        """다운로드 완료 처리 (메인 스레드에서 호출됨)"""
+        if self._update_progress:
+            self._update_progress.close()
+            self._update_progress = None
+        if ok:
+            QMessageBox.information(
+                None, "업데이트 완료",
+                "다운로드가 완료되었습니다.\n프로그램을 종료하면 새 버전이 실행됩니다."
+            )
+            import subprocess
+            subprocess.Popen([dest])  # 새 업데이터 실행
+            logger.info("새 업데이터 실행 후 현재 애플리케이션 종료 요청")
+            self.safe_exit()
+        else:
+            QMessageBox.warning(None, "업데이트 실패", "업데이트 파일 다운로드에 실패했습니다.")
+
     def safe_exit(self):
         logger.info("트레이 아이콘에서 종료 요청됨")
         if self.widget:
@@ -372,9 +664,11 @@ class ApplicationManager:
             self.tray_icon.hide()
         self.cleanup_resources()
         logger.info("애플리케이션 정상 종료")
-        # QTimer.singleShot(200, lambda: os._exit(0)) # os._exit() 대신 QApplication.quit() 사용
-        if QApplication.instance():
-            QApplication.instance().quit()
+        # 고정 지연(QTimer.singleShot + os._exit) 없이 즉시 이벤트 루프 종료
+        # (quit()가 루프를 빠져나가며 대기 중인 deleteLater를 처리함)
+        app = QApplication.instance()
+        if app:
+            app.quit()
 
     def _sync_auto_start_setting(self):
         """애플리케이션 시작 시 자동 시작 설정을 시스템 상태와 동기화합니다."""
@@ -400,12 +694,7 @@ class ApplicationManager:
             system_is_enabled = is_auto_start_enabled(app_name_for_shortcut=app_name_for_shortcut)
 
             executable_path = get_executable_path()
-            icon_path = resource_path("assets/app_icon.ico")
-            if not os.path.exists(icon_path):
-                icon_path = resource_path("assets/icon.ico")
-            if not os.path.exists(icon_path): # 아이콘 파일이 아예 없는 경우
-                icon_path = executable_path # 실행 파일 자체 아이콘 사용
-
+            icon_path = _resolve_icon_path()
 
             if current_setting_enabled != system_is_enabled:
                 logger.info(f"자동 시작 설정 동기화 필요: 설정({current_setting_enabled}), 시스템({system_is_enabled})")
@@ -444,35 +733,6 @@ def main():
         version_str = get_version_string()
         logger.info(f"학교시간표위젯 {version_str} 시작")
 
-        # 자동 업데이트 확인
-        updater = Updater(get_version())
-        if updater.check_for_update():
-            from PyQt5.QtWidgets import QMessageBox, QProgressDialog
-            app = QApplication.instance() or QApplication(sys.argv)
-            msg = f"새 버전({updater.latest_version})이 출시되었습니다!\n\n릴리즈 노트:\n{updater.release_notes}\n\n지금 다운로드하시겠습니까?"
-            reply = QMessageBox.question(None, "업데이트 알림", msg, QMessageBox.Yes | QMessageBox.No)
-            if reply == QMessageBox.Yes:
-                import tempfile
-                import os
-                dest = os.path.join(tempfile.gettempdir(), f"school_timetable_update_{updater.latest_version}.exe")
-                progress = QProgressDialog("업데이트 다운로드 중...", None, 0, 100)
-                progress.setWindowTitle("업데이트")
-                progress.setWindowModality(Qt.ApplicationModal)
-                def cb(done, total):
-                    progress.setValue(int(done/total*100))
-                ok = updater.download_update(dest, progress_callback=cb)
-                progress.close()
-                if ok:
-                    QMessageBox.information(None, "업데이트 완료", f"다운로드가 완료되었습니다.\n프로그램을 종료하면 새 버전이 실행됩니다.")
-                    # 종료 후 새 exe 실행
-                    import subprocess
-                    subprocess.Popen([dest]) # 새 업데이터 실행
-                    logger.info("새 업데이터 실행 후 현재 애플리케이션 종료 요청")
-                    if QApplication.instance():
-                        QApplication.instance().quit() # 현재 앱 종료
-                    return 0 # main 함수 종료
-                else:
-                    QMessageBox.warning(None, "업데이트 실패", "업데이트 파일 다운로드에 실패했습니다.")
         app_manager = ApplicationManager()
         exit_code = app_manager.run()
         return exit_code
@@ -494,5 +754,6 @@ def main():
         return 1
 
 if __name__ == "__main__":
+    import multiprocessing
     multiprocessing.freeze_support()
     sys.exit(main())
\ No newline at end of file
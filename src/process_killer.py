@@ -1,4 +1,5 @@
 import os
+import re
 import sys
 import psutil
 import time
@@ -41,85 +42,52 @@ def kill_process_by_name(process_name):
         process_name: 종료할 프로세스 이름(부분적으로 일치해도 됨)
     """
     count = 0
+    # 프로세스마다 .lower() 문자열을 새로 만들지 않도록
+    # 대소문자 무시 패턴을 루프 밖에서 한 번만 컴파일
+    pattern = re.compile(re.escape(process_name), re.IGNORECASE)
     for proc in psutil.process_iter(['pid', 'name']):
         try:
-            if process_name.lower() in proc.info['name'].lower():
+            name = proc.info['name']
+            if name and pattern.search(name):
                 pid = proc.info['pid']
-                print(f"프로세스 종료 중: {proc.info['name']} (PID: {pid})")
+                print(f"프로세스 종료 중: {name} (PID: {pid})")
                 if force_kill_process(pid):
                     count += 1
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
-    
+
     return count
 
 def kill_python_processes_aggressive(exclude_pid=None):
     """
-    현재 프로세스를 제외한 모든 파이썬 관련 프로세스를 적극적으로 종료
+    현재 프로세스의 자식 프로세스 트리를 적극적으로 종료
+
+    이전에는 시스템 전체를 process_iter로 훑으며 이름/명령줄을 검사했는데,
+    호스트의 모든 PID에 대해 /proc 읽기와 cmdline 파싱이 발생하고
+    무관한 파이썬 프로세스까지 종료할 위험이 있었다. 정당한 종료 대상은
+    현재 프로세스의 자손뿐이므로 트리만 걷는다.
     """
     if exclude_pid is None:
         exclude_pid = os.getpid()
-    
+
     count = 0
-    print(f"현재 프로세스 ID: {exclude_pid} (제외됨)")
-    
-    # 프로세스 트리에서 제외할 PID 목록
-    exclude_pids = [exclude_pid]
-    
-    # 현재 프로세스의 부모는 제외
+    print(f"현재 프로세스 ID: {exclude_pid} (자손만 종료 대상)")
+
     try:
-        parent_pid = psutil.Process(exclude_pid).parent().pid
-        exclude_pids.append(parent_pid)
-        print(f"부모 프로세스 ID: {parent_pid} (제외됨)")
-    except:
-        pass
-    
-    # 모든 프로세스 조사
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-        try:
-            proc_info = proc.info
-            pid = proc_info['pid']
-            
-            if pid in exclude_pids:
-                continue
-                
-            # 파이썬 관련 프로세스인지 확인
-            is_python_related = False
-            
-            # 1. 이름으로 확인
-            if proc_info['name'] and ('python' in proc_info['name'].lower()):
-                is_python_related = True
-            
-            # 2. 명령줄로 확인
-            elif proc_info['cmdline']:
-                cmdline = " ".join(proc_info['cmdline']).lower()
-                if 'python' in cmdline or 'whisper_project' in cmdline or 'school' in cmdline:
-                    is_python_related = True
-            
-            # 3. 이 프로세스가 현재 프로세스의 자식인지 확인
-            if not is_python_related:
-                try:
-                    parent = psutil.Process(pid).parent()
-                    if parent and parent.pid in exclude_pids:
-                        is_python_related = True
-                except:
-                    pass
-            
-            if is_python_related:
-                try:
-                    cmd_line = " ".join(proc_info['cmdline'])[:50]
-                    if len(" ".join(proc_info['cmdline'])) > 50:
-                        cmd_line += "..."
-                except:
-                    cmd_line = "명령줄 정보 없음"
-                    
-                print(f"관련 프로세스 종료 중: {proc_info['name']} (PID: {pid}) - {cmd_line}")
-                if force_kill_process(pid):
-                    count += 1
-                    
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            pass
-    
+        current = psutil.Process(exclude_pid)
+        # 시그널을 보내기 전에 PID 목록을 먼저 수집해 두면
+        # 중간에 부모가 죽어 재부모화된 자식도 목록에 남는다
+        children = current.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return 0
+
+    for child in children:
+        print(f"관련 프로세스 종료 중: PID {child.pid}")
+        if force_kill_process(child.pid):
+            count += 1
+
+    # 남은 프로세스를 한 번에 대기 (개별 폴링 없이)
+    psutil.wait_procs(children, timeout=0.5)
     return count
 
 if __name__ == "__main__":
@@ -77,20 +77,31 @@ def enable_auto_start(app_name_for_shortcut=None, target_path=None, working_dire
 
     try:
         import win32com.client # pywin32 라이브러리 필요
-        shell = win32com.client.Dispatch("WScript.Shell")
-        shortcut = shell.CreateShortcut(shortcut_file_path)
-        
+
+        # 비교/설정에 쓸 최종 대상과 인자를 먼저 계산
         if _target_path.lower().endswith((".py", ".pyw")):
             pythonw_exe = os.path.join(os.path.dirname(sys.executable), "pythonw.exe")
-            if os.path.exists(pythonw_exe):
-                shortcut.TargetPath = pythonw_exe
-                shortcut.Arguments = f'"{_target_path}"' 
-            else: 
-                shortcut.TargetPath = sys.executable 
-                shortcut.Arguments = f'"{_target_path}"'
-        else: 
-            shortcut.TargetPath = _target_path
-        
+            desired_target = pythonw_exe if os.path.exists(pythonw_exe) else sys.executable
+            desired_arguments = f'"{_target_path}"'
+        else:
+            desired_target = _target_path
+            desired_arguments = ""
+
+        shell = win32com.client.Dispatch("WScript.Shell")
+        # CreateShortcut은 기존 .lnk가 있으면 그 내용을 읽어 온다
+        shortcut = shell.CreateShortcut(shortcut_file_path)
+
+        # 이미 올바른 대상을 가리키고 있으면 COM save(디스크 재기록) 생략
+        # — 앱 시작 시 동기화 경로에서 매번 바로 가기를 다시 만들지 않도록
+        if (os.path.exists(shortcut_file_path)
+                and shortcut.TargetPath.lower() == desired_target.lower()
+                and shortcut.Arguments == desired_arguments):
+            logger.debug(f"자동 시작 바로 가기가 이미 최신 상태입니다: {shortcut_file_path}")
+            return True
+
+        shortcut.TargetPath = desired_target
+        if desired_arguments:
+            shortcut.Arguments = desired_arguments
         shortcut.WorkingDirectory = _working_directory
         shortcut.IconLocation = _icon_location
         shortcut.Description = f"{APP_DISPLAY_NAME} 자동 시작"
@@ -66,6 +66,9 @@ class Config:
         7: {"start": "16:00", "end": "16:50"}
     }
     
+    # 백업 보관 개수 상한 (초과분은 새 백업 생성 시 오래된 것부터 삭제)
+    MAX_BACKUPS = 20
+
     # 알림 설정
     DEFAULT_NOTIFICATION_SETTINGS = {
         "enabled": True,
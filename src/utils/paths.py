@@ -83,7 +83,10 @@ def get_cache_directory():
 def get_log_directory():
     """로그 파일 저장 디렉토리 반환"""
     log_dir = os.path.join(get_data_directory(), "logs")
-    os.makedirs(log_dir, exist_ok=True)
+    # isdir은 stat 1회로 끝나지만 makedirs(exist_ok=True)는
+    # 경로 구성요소마다 stat하므로 존재 확인 후에만 생성
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
     return log_dir
 
 def ensure_data_directory_exists():
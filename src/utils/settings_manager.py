@@ -1,8 +1,19 @@
+import bisect
 import json
 import os
+import re
+import sys
 import datetime
 import shutil
 import logging
+
+# orjson이 설치되어 있으면 사용 (stdlib json 대비 파싱/직렬화가 수 배 빠름).
+# 필수 의존성은 아니므로 없으면 기존 json으로 동작한다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt5 import QtCore
 from utils.paths import (
     get_timetable_file_path, get_settings_file_path, 
@@ -22,6 +33,105 @@ from utils.exceptions import DataError, ConfigError
 #     return os.path.join(get_data_directory(), "notification_settings.json")
 from utils.paths import get_notification_settings_file_path # 여기서 임포트
 
+def _json_loads(data):
+    """바이트열을 JSON으로 파싱 (orjson 우선, 없으면 stdlib json)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps_bytes(obj):
+    """객체를 들여쓰기된 JSON 바이트열로 직렬화"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _parse_hhmm(value):
+    """'HH:MM' 문자열을 (시, 분) 정수쌍으로 파싱
+
+    저장 형식은 항상 두 자리 제로 패딩이므로 슬라이스 두 번으로 끝낸다
+    (split은 리스트 + 부분 문자열 할당을 동반). 손으로 고친 파일의
+    'H:MM' 꼴만 split 경로로 처리한다.
+    """
+    if len(value) == 5:
+        return int(value[:2]), int(value[3:])
+    hour, minute = value.split(':')
+    return int(hour), int(minute)
+
+# 스타일 설정 파일에 저장/로드되는 속성 이름 (load/save 양쪽이 공유하는 단일 스키마)
+_STYLE_KEYS = (
+    "header_bg_color", "header_text_color",
+    "cell_bg_color", "cell_text_color",
+    "current_period_color", "border_color",
+    "header_opacity", "cell_opacity",
+    "current_period_opacity", "border_opacity",
+    "font_family", "font_size",
+    "header_font_family", "header_font_size",
+    "cell_font_family", "cell_font_size",
+    "theme",
+)
+
+# 테마 전환이 건드리는 키 부분집합 (폰트 관련 키는 테마와 무관)
+_THEME_KEYS = (
+    "header_bg_color", "header_text_color",
+    "cell_bg_color", "cell_text_color",
+    "current_period_color", "border_color",
+    "header_opacity", "cell_opacity",
+    "current_period_opacity", "border_opacity",
+    "theme",
+)
+
+# 백업 폴더명 형식 (create_backup의 기본 명명 규칙과 일치)
+_BACKUP_NAME_RE = re.compile(r'backup_(\d{8})_(\d{6})$')
+
+# 경로 → (mtime_ns, 파싱 결과) 캐시. 설정 파일은 세션 중 거의 바뀌지 않으므로
+# mtime이 같으면 재파싱 없이 이전 결과를 그대로 돌려준다.
+_FILE_CACHE = {}
+
+def _cached_json_load(file_path):
+    """mtime이 변하지 않았으면 캐시된 파싱 결과를 반환하는 JSON 로더"""
+    st = os.stat(file_path)
+    entry = _FILE_CACHE.get(file_path)
+    if entry is not None and entry[0] == st.st_mtime_ns:
+        return entry[1]
+    with open(file_path, 'rb') as f:
+        obj = _json_loads(f.read())
+    _FILE_CACHE[file_path] = (st.st_mtime_ns, obj)
+    return obj
+
+def _update_json_cache(file_path, obj):
+    """save_* 직후 호출해 방금 쓴 객체로 캐시를 갱신 (다음 로드의 재파싱 방지)"""
+    try:
+        _FILE_CACHE[file_path] = (os.stat(file_path).st_mtime_ns, obj)
+    except OSError:
+        _FILE_CACHE.pop(file_path, None)
+
+def _atomic_write_json(file_path, obj):
+    """임시 파일에 전체를 쓴 뒤 os.replace로 교체하는 원자적 저장
+
+    직렬화 결과를 한 번의 write로 기록하고 fsync 후 교체하므로,
+    쓰기 도중 프로세스가 죽어도 기존 파일이 온전히 남는다
+    (다음 로드에서 JSONDecodeError → 백업 복구 경로를 탈 일이 없음).
+
+    내용이 디스크의 현재 상태와 동일하면 직렬화/쓰기를 통째로 생략한다.
+    테마 재선택이나 제자리 드래그처럼 값이 실제로 바뀌지 않은 save_*
+    호출이 UI 경로에 여럿 있기 때문이다. 속성 변경이 세터를 거치지 않고
+    직접 일어나는 코드가 많아 더티 플래그 대신 내용 비교로 판정한다.
+    """
+    entry = _FILE_CACHE.get(file_path)
+    if entry is not None and entry[1] == obj:
+        try:
+            if os.stat(file_path).st_mtime_ns == entry[0]:
+                return
+        except OSError:
+            pass  # 파일이 외부에서 삭제/변경됨 — 새로 쓴다
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_json_dumps_bytes(obj))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+    _update_json_cache(file_path, obj)
+
 class SettingsManager:
     """설정 관리 클래스"""
     
@@ -76,10 +186,12 @@ class SettingsManager:
         
         # 기본 시간 설정 (config에서 가져옴)
         self.time_ranges = {}
+        # 마지막으로 QTime 변환까지 마친 시간 설정 파싱 결과 (재변환 생략용)
+        self._applied_time_settings = None
         for period, time_info in Config.DEFAULT_TIME_RANGES.items():
-            start_hour, start_min = map(int, time_info["start"].split(':'))
-            end_hour, end_min = map(int, time_info["end"].split(':'))
-            
+            start_hour, start_min = _parse_hhmm(time_info["start"])
+            end_hour, end_min = _parse_hhmm(time_info["end"])
+
             self.time_ranges[period] = {
                 "start": QtCore.QTime(start_hour, start_min),
                 "end": QtCore.QTime(end_hour, end_min)
@@ -98,13 +210,29 @@ class SettingsManager:
         
         # 설정 불러오기
         self.load_all_settings()
+
+        # 교시 조회용 정수 인덱스 구축 (타이머 틱마다 도는 핫패스용)
+        self._rebuild_time_index()
         
     def load_all_settings(self):
-        """모든 설정 불러오기"""
-        self.load_style_settings()
-        self.load_time_settings()
-        self.load_timetable_data()
-        self.load_widget_settings() # load_widget_position에서 이름 변경 고려 또는 통합
+        """모든 설정 불러오기
+
+        네 로더는 서로 다른 파일을 읽고 서로 겹치지 않는 속성만 기록하므로
+        잠금 없이 동시에 실행해도 안전하다. open/stat/read가 각각 syscall
+        바운드라 스레드로 겹치면 전체 소요가 네 파일의 합이 아니라
+        가장 느린 하나에 수렴한다 (콜드 캐시 Windows에서 특히 유효).
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        loaders = (
+            self.load_style_settings,
+            self.load_time_settings,
+            self.load_timetable_data,
+            self.load_widget_settings, # load_widget_position에서 이름 변경 고려 또는 통합
+        )
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = [executor.submit(loader) for loader in loaders]
+        for future in futures:
+            future.result()  # 로더가 던진 예외(DataError 등)를 호출자에게 전파
     
     # Style Settings
     def load_style_settings(self):
@@ -116,34 +244,30 @@ class SettingsManager:
             return
             
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                style_settings = json.load(f)
-            
-            # 저장된 설정 적용
-            self.header_bg_color = style_settings.get("header_bg_color", self.header_bg_color)
-            self.header_text_color = style_settings.get("header_text_color", self.header_text_color)
-            self.cell_bg_color = style_settings.get("cell_bg_color", self.cell_bg_color)
-            self.cell_text_color = style_settings.get("cell_text_color", self.cell_text_color)
-            self.current_period_color = style_settings.get("current_period_color", self.current_period_color)
-            self.border_color = style_settings.get("border_color", self.border_color)
-            self.header_opacity = style_settings.get("header_opacity", self.header_opacity)
-            self.cell_opacity = style_settings.get("cell_opacity", self.cell_opacity)
-            self.current_period_opacity = style_settings.get("current_period_opacity", self.current_period_opacity)
-            self.border_opacity = style_settings.get("border_opacity", self.border_opacity)
-            
-            # 기존 폰트 설정 (호환성 유지)
-            self.font_family = style_settings.get("font_family", self.font_family)
-            self.font_size = style_settings.get("font_size", self.font_size)
-            
-            # 헤더 및 셀 개별 폰트 설정 로드
-            self.header_font_family = style_settings.get("header_font_family", self.font_family)
-            self.header_font_size = style_settings.get("header_font_size", self.font_size)
-            self.cell_font_family = style_settings.get("cell_font_family", self.font_family)
-            self.cell_font_size = style_settings.get("cell_font_size", self.font_size)
-            
-            # 테마 설정 로드
-            self.theme = style_settings.get("theme", self.theme)
-            
+            style_settings = _cached_json_load(file_path)
+
+            # 색상/폰트 문자열은 헤더·셀·테마에 걸쳐 같은 값이 반복된다.
+            # intern해 두면 중복 사본이 합쳐지고 이후 == 비교가
+            # 포인터 동일성에서 단락되어 스타일 키 비교가 싸진다
+            style_settings = {
+                k: sys.intern(v) if isinstance(v, str) else v
+                for k, v in style_settings.items()
+            }
+
+            # 저장된 설정 적용: 키별 get/저장 15회 대신 C 수준 dict update 한 번.
+            # 파일에 없는 키는 기존 속성값(기본값)을 그대로 유지한다
+            self.__dict__.update(
+                (k, style_settings[k]) for k in _STYLE_KEYS if k in style_settings
+            )
+
+            # 개별 폰트 키가 없는 구버전 파일은 공통 폰트 값으로 채움 (기존 동작 유지)
+            for key in ("header_font_family", "cell_font_family"):
+                if key not in style_settings:
+                    setattr(self, key, self.font_family)
+            for key in ("header_font_size", "cell_font_size"):
+                if key not in style_settings:
+                    setattr(self, key, self.font_size)
+
             # self.auto_start_enabled = style_settings.get("auto_start_enabled", False) # widget_settings.json으로 이동
             
             self.logger.info("스타일 설정을 성공적으로 로드했습니다.")
@@ -158,36 +282,42 @@ class SettingsManager:
     def save_style_settings(self):
         """스타일 설정 저장"""
         try:
-            style_settings = {
-                "header_bg_color": self.header_bg_color,
-                "header_text_color": self.header_text_color,
-                "cell_bg_color": self.cell_bg_color,
-                "cell_text_color": self.cell_text_color,
-                "current_period_color": self.current_period_color,
-                "border_color": self.border_color,
-                "header_opacity": self.header_opacity,
-                "cell_opacity": self.cell_opacity,
-                "current_period_opacity": self.current_period_opacity,
-                "border_opacity": self.border_opacity,
-                "font_family": self.font_family,
-                "font_size": self.font_size,
-                # 헤더 및 셀 폰트 설정 추가
-                "header_font_family": self.header_font_family,
-                "header_font_size": self.header_font_size,
-                "cell_font_family": self.cell_font_family,
-                "cell_font_size": self.cell_font_size,
-                "theme": self.theme
-                # "auto_start_enabled": getattr(self, 'auto_start_enabled', False) # widget_settings.json으로 이동
-            }
-            
-            file_path = get_style_settings_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(style_settings, f, ensure_ascii=False, indent=2)
+            # 로드와 같은 _STYLE_KEYS 스키마에서 생성 — 키를 두 곳에 중복 나열하지 않음
+            # ("auto_start_enabled"는 widget_settings.json으로 이동)
+            style_settings = {k: getattr(self, k) for k in _STYLE_KEYS}
+
+            _atomic_write_json(get_style_settings_file_path(), style_settings)
             self.logger.info("스타일 설정을 성공적으로 저장했습니다.")
         except Exception as e:
             self.logger.error(f"스타일 설정 저장 오류: {e}")
             raise DataError("스타일 설정 저장 실패", str(e))
             
+    def _save_style_subset(self, keys):
+        """스타일 파일에서 지정한 키만 현재 속성값으로 갱신해 저장
+
+        읽기-수정-쓰기 방식이라 나머지 키(폰트 등)는 디스크의 기존
+        값 그대로 유지된다 — 테마 토글 때마다 사용자 폰트 설정이
+        동일 내용으로 재직렬화되는 일을 막는다. 파일이 없거나 손상된
+        경우에는 전체 스키마로 새로 쓴다.
+        """
+        try:
+            file_path = get_style_settings_file_path()
+            existing = None
+            if os.path.exists(file_path):
+                try:
+                    # 캐시 객체를 직접 수정하지 않도록 얕은 복사
+                    existing = dict(_cached_json_load(file_path))
+                except Exception as e:
+                    self.logger.warning(f"스타일 설정 파일 재사용 실패, 전체 저장으로 대체: {e}")
+            if existing is None:
+                existing = {k: getattr(self, k) for k in _STYLE_KEYS}
+            else:
+                existing.update((k, getattr(self, k)) for k in keys)
+            _atomic_write_json(file_path, existing)
+        except Exception as e:
+            self.logger.error(f"스타일 설정 저장 오류: {e}")
+            raise DataError("스타일 설정 저장 실패", str(e))
+
     def change_theme(self, theme_name):
         """테마 변경"""
         if theme_name not in [Config.THEME_LIGHT, Config.THEME_DARK, Config.THEME_CUSTOM]:
@@ -197,8 +327,12 @@ class SettingsManager:
         try:
             # 커스텀 테마가 아니면 미리 정의된 테마 설정 적용
             if theme_name != Config.THEME_CUSTOM:
-                theme_styles = Config.THEMES[theme_name]
-                
+                # 로드 경로와 동일하게 문자열 값을 intern해 통일
+                theme_styles = {
+                    k: sys.intern(v) if isinstance(v, str) else v
+                    for k, v in Config.THEMES[theme_name].items()
+                }
+
                 # 테마 설정 적용
                 self.header_bg_color = theme_styles["header_bg_color"]
                 self.header_text_color = theme_styles["header_text_color"]
@@ -213,10 +347,10 @@ class SettingsManager:
                 
                 # 테마 값 저장
                 self.theme = theme_name
-                
-                # 설정 저장
-                self.save_style_settings()
-                
+
+                # 설정 저장: 테마가 건드린 키만 기존 파일에 병합
+                self._save_style_subset(_THEME_KEYS)
+
             self.logger.info(f"테마 변경 완료: {theme_name}")
             return True
         except Exception as e:
@@ -229,59 +363,91 @@ class SettingsManager:
         try:
             file_path = get_settings_file_path()
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    time_settings = json.load(f)
-                
+                time_settings = _cached_json_load(file_path)
+
+                # mtime 캐시가 이전과 같은 객체를 돌려줬다면 내용 불변 —
+                # 교시마다 QTime 두 개를 다시 생성(PyQt 경계 왕복)할 이유가 없다
+                if time_settings is self._applied_time_settings:
+                    return
+
                 # 저장된 설정 적용
                 for period, time_range in time_settings.items():
                     period = int(period)  # JSON에서는 키가 문자열로 저장됨
-                    start_hour, start_min = map(int, time_range["start"].split(':'))
-                    end_hour, end_min = map(int, time_range["end"].split(':'))
-                    
+                    start_hour, start_min = _parse_hhmm(time_range["start"])
+                    end_hour, end_min = _parse_hhmm(time_range["end"])
+
                     self.time_ranges[period] = {
                         "start": QtCore.QTime(start_hour, start_min),
                         "end": QtCore.QTime(end_hour, end_min)
                     }
+                self._applied_time_settings = time_settings
+                self._rebuild_time_index()
         except Exception as e:
             self.logger.error(f"시간 설정 로드 오류: {e}")
     
     def save_time_settings(self):
         """시간 설정 저장"""
         try:
+            # 다이얼로그들이 time_ranges를 직접 수정한 뒤 저장을 호출하므로
+            # 이 시점이 인덱스를 따라잡게 할 가장 확실한 지점이다
+            self._rebuild_time_index()
+            # toString("HH:mm")은 호출마다 Qt가 포맷 문자열을 재해석하므로
+            # 값만 꺼내 파이썬 포매팅으로 처리 (_parse_hhmm과 대칭)
             time_settings = {}
             for period, time_range in self.time_ranges.items():
-                start_time = time_range["start"].toString("HH:mm")
-                end_time = time_range["end"].toString("HH:mm")
-                
+                start = time_range["start"]
+                end = time_range["end"]
                 time_settings[str(period)] = {
-                    "start": start_time,
-                    "end": end_time
+                    "start": f"{start.hour():02d}:{start.minute():02d}",
+                    "end": f"{end.hour():02d}:{end.minute():02d}"
                 }
             
-            file_path = get_settings_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(time_settings, f, ensure_ascii=False, indent=2)
+            _atomic_write_json(get_settings_file_path(), time_settings)
         except Exception as e:
             self.logger.error(f"시간 설정 저장 오류: {e}")
     
     # Timetable Data
+
+    # 이 크기를 넘는 시간표 파일은 스트리밍 파싱으로 전환 (피크 메모리 평탄화)
+    _STREAM_PARSE_THRESHOLD = 256 * 1024
+
     def load_timetable_data(self):
         """저장된 시간표 데이터 불러오기"""
         try:
             file_path = get_timetable_file_path()
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.timetable_data = json.load(f)
+                if os.path.getsize(file_path) > self._STREAM_PARSE_THRESHOLD:
+                    self.timetable_data = self._load_timetable_streaming(file_path)
+                else:
+                    self.timetable_data = _cached_json_load(file_path)
         except Exception as e:
             self.logger.error(f"시간표 데이터 로드 오류: {e}")
             self.timetable_data = {}
+
+    def _load_timetable_streaming(self, file_path):
+        """큰 시간표 파일을 ijson으로 증분 파싱
+
+        전체 바이트를 읽어 한 번에 파싱하면 원본 버퍼 + 완성 트리가 동시에
+        메모리에 존재한다. ijson은 최상위 키-값 쌍을 순차로 내어 주므로
+        피크 메모리가 완성 트리 크기로 수렴한다. ijson이 설치되어 있지
+        않으면(선택 의존성) 일반 경로로 동작한다.
+        """
+        entry = _FILE_CACHE.get(file_path)
+        if entry is not None and entry[0] == os.stat(file_path).st_mtime_ns:
+            return entry[1]  # mtime 불변 — 스트리밍 재파싱도 생략
+        try:
+            import ijson
+        except ImportError:
+            return _cached_json_load(file_path)
+        with open(file_path, 'rb') as f:
+            data = {key: value for key, value in ijson.kvitems(f, '')}
+        _update_json_cache(file_path, data)
+        return data
     
     def save_timetable_data(self):
         """시간표 데이터 저장"""
         try:
-            file_path = get_timetable_file_path()
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.timetable_data, f, ensure_ascii=False, indent=2)
+            _atomic_write_json(get_timetable_file_path(), self.timetable_data)
         except Exception as e:
             self.logger.error(f"시간표 데이터 저장 오류: {e}")
     
@@ -291,8 +457,7 @@ class SettingsManager:
         try:
             file_path = get_widget_settings_file_path() # utils.paths 사용
             if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    widget_settings = json.load(f)
+                widget_settings = _cached_json_load(file_path)
                 self.widget_position = widget_settings.get("position", self.widget_position)
                 self.widget_size = widget_settings.get("size", self.widget_size)
                 self.is_position_locked = widget_settings.get("is_position_locked", False)
@@ -321,9 +486,7 @@ class SettingsManager:
                 "screen_info": self.widget_screen_info,
                 "auto_start_enabled": getattr(self, 'auto_start_enabled', False) # 자동 시작 설정 저장
             }
-            file_path = get_widget_settings_file_path() # utils.paths 사용
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(widget_settings, f, ensure_ascii=False, indent=2)
+            _atomic_write_json(get_widget_settings_file_path(), widget_settings) # utils.paths 사용
             self.logger.info("위젯 설정을 성공적으로 저장했습니다.")
         except Exception as e:
             self.logger.error(f"위젯 설정 저장 오류: {e}")
@@ -359,12 +522,33 @@ class SettingsManager:
         self.save_timetable_data()
         return self.timetable_data
     
+    def _rebuild_time_index(self):
+        """time_ranges로부터 초 단위 정수 인덱스를 재생성
+
+        get_current_period는 위젯 타이머가 깨어날 때마다 호출되는데,
+        QTime 비교는 교시마다 PyQt 바인딩을 두 번씩 넘나든다. 시작 시각
+        기준으로 정렬한 (시작초, 끝초, 교시) 튜플 리스트를 미리 만들어
+        조회를 bisect 한 번 + 정수 비교 두 번으로 줄인다.
+        """
+        self._time_index = sorted(
+            (
+                tr["start"].hour() * 3600 + tr["start"].minute() * 60 + tr["start"].second(),
+                tr["end"].hour() * 3600 + tr["end"].minute() * 60 + tr["end"].second(),
+                period,
+            )
+            for period, tr in self.time_ranges.items()
+        )
+        self._time_starts = [entry[0] for entry in self._time_index]
+
     def get_current_period(self, current_time):
         """현재 시간에 해당하는 교시 반환"""
-        for period, time_range in self.time_ranges.items():
-            start_time = time_range["start"]
-            end_time = time_range["end"]
-            if start_time <= current_time <= end_time:
+        seconds = (current_time.hour() * 3600
+                   + current_time.minute() * 60
+                   + current_time.second())
+        i = bisect.bisect_right(self._time_starts, seconds) - 1
+        if i >= 0:
+            _start, end, period = self._time_index[i]
+            if seconds <= end:
                 return period
         return None
 
@@ -390,21 +574,15 @@ class SettingsManager:
             from utils.paths import ensure_data_directory_exists, get_data_directory
             data_dir = ensure_data_directory_exists()
             
-            # 백업 디렉토리 생성
-            backup_dir = os.path.join(data_dir, "backups")
-            if not os.path.exists(backup_dir):
-                os.makedirs(backup_dir)
-            
             # 백업 이름 설정 (지정되지 않은 경우 날짜 사용)
+            now = datetime.datetime.now()
             if not backup_name:
-                now = datetime.datetime.now()
                 backup_name = f"backup_{now.strftime('%Y%m%d_%H%M%S')}"
-            
-            # 백업 폴더 생성
-            backup_path = os.path.join(backup_dir, backup_name)
-            if not os.path.exists(backup_path):
-                os.makedirs(backup_path)
-            
+
+            # 백업 폴더 생성 (중간 경로 포함 한 번의 호출로 — 사전 exists 검사 불필요)
+            backup_path = os.path.join(data_dir, "backups", backup_name)
+            os.makedirs(backup_path, exist_ok=True)
+
             # 필요한 파일 목록
             files_to_backup = [
                 ("timetable_data.json", get_timetable_file_path()),
@@ -413,23 +591,49 @@ class SettingsManager:
                 ("widget_settings.json", get_widget_settings_file_path()),
                 ("notification_settings.json", get_notification_settings_file_path()),  # 수정된 함수 사용
             ]
-            
-            # 파일 복사
-            for backup_filename, source_path in files_to_backup:
-                if os.path.exists(source_path):
-                    shutil.copy2(source_path, os.path.join(backup_path, backup_filename))
+
+            # 파일 복사: 각 복사는 독립적인 syscall 바운드 작업이므로 스레드로
+            # 겹쳐 전체 소요를 합이 아닌 최대값으로 줄인다. 메타데이터 보존이
+            # 필요 없는 JSON 설정이라 copy2 대신 copyfile을 쓴다.
+            pairs = [
+                (source_path, os.path.join(backup_path, backup_filename))
+                for backup_filename, source_path in files_to_backup
+                if os.path.exists(source_path)
+            ]
+            if pairs:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+                    list(executor.map(lambda p: shutil.copyfile(*p), pairs))
             
             # 백업 설명 파일 생성
             description = f"시간표 백업 - {now.strftime('%Y년 %m월 %d일 %H:%M:%S')}"
             with open(os.path.join(backup_path, "description.txt"), 'w', encoding='utf-8') as f:
                 f.write(description)
-            
+
+            # 보관 개수 상한 적용 — 목록 조회가 세션 이력에 비례해
+            # 느려지지 않도록 생성 시점에 오래된 백업을 정리한다
+            self._prune_old_backups(os.path.dirname(backup_path))
+
             return True, backup_path
             
         except Exception as e:
             self.logger.error(f"백업 생성 오류: {e}")
             return False, str(e)
 
+    def _prune_old_backups(self, backup_dir):
+        """백업 개수를 Config.MAX_BACKUPS 이하로 유지 (오래된 것부터 삭제)"""
+        try:
+            with os.scandir(backup_dir) as it:
+                dirs = [e for e in it if e.is_dir(follow_symlinks=False)]
+            if len(dirs) <= Config.MAX_BACKUPS:
+                return
+            dirs.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            for entry in dirs[Config.MAX_BACKUPS:]:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                self.logger.info(f"오래된 백업 삭제: {entry.name}")
+        except Exception as e:
+            self.logger.error(f"백업 정리 중 오류: {e}")
+
     def restore_backup(self, backup_name):
         """지정된 백업에서 설정 복원"""
         try:
@@ -449,16 +653,17 @@ class SettingsManager:
                 ("notification_settings.json", get_notification_settings_file_path()),
             ]
             
-            # 파일 복사
+            # 파일 복원: 대상 디렉토리를 먼저 보장한 뒤 복사를 스레드로 겹친다
+            pairs = []
             for backup_filename, target_path in files_to_restore:
                 source_path = os.path.join(backup_path, backup_filename)
                 if os.path.exists(source_path):
-                    # 대상 파일 경로의 디렉토리 확인
-                    target_dir = os.path.dirname(target_path)
-                    if not os.path.exists(target_dir):
-                        os.makedirs(target_dir)
-                    # 파일 복원
-                    shutil.copy2(source_path, target_path)
+                    os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                    pairs.append((source_path, target_path))
+            if pairs:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+                    list(executor.map(lambda p: shutil.copyfile(*p), pairs))
             
             # 설정 다시 로드
             self.load_all_settings()
@@ -478,40 +683,49 @@ class SettingsManager:
             if not os.path.exists(backup_dir):
                 return []
             
-            # 디렉토리만 찾기
+            # scandir는 디렉토리 열거 한 번으로 항목 타입/stat을 캐시하므로
+            # 항목마다 isdir/getmtime stat을 따로 날리던 것과 달리
+            # 백업 폴더당 syscall이 상수 개로 줄어든다
             backups = []
-            for item in os.listdir(backup_dir):
-                item_path = os.path.join(backup_dir, item)
-                if os.path.isdir(item_path):
+            with os.scandir(backup_dir) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
                     # 백업 정보 읽기
-                    desc_file = os.path.join(item_path, "description.txt")
+                    desc_file = os.path.join(entry.path, "description.txt")
                     description = ""
                     if os.path.exists(desc_file):
                         with open(desc_file, 'r', encoding='utf-8') as f:
                             description = f.read().strip()
-                    
-                    # 생성 시간 구하기
+
+                    # 생성 시간 구하기 (폴더명 형식이 맞으면 이름에서, 아니면 mtime)
                     created_time = None
-                    try:
-                        parts = item.split('_')
-                        if len(parts) >= 2 and parts[0] == "backup":
-                            date_str = parts[1]
-                            time_str = parts[2] if len(parts) > 2 else "000000"
-                            timestamp = f"{date_str}_{time_str}"
-                            created_time = datetime.datetime.strptime(timestamp, "%Y%m%d_%H%M%S")
-                    except:
-                        # 파일 생성 시간 대신 폴더 수정 시간 사용
-                        created_time = datetime.datetime.fromtimestamp(os.path.getmtime(item_path))
-                    
+                    match = _BACKUP_NAME_RE.match(entry.name)
+                    if match:
+                        # 자릿수는 정규식이 보장하므로 strptime의 포맷 문자열
+                        # 해석 없이 슬라이스로 바로 생성 (유효 범위만 확인)
+                        d, t = match.group(1), match.group(2)
+                        try:
+                            created_time = datetime.datetime(
+                                int(d[0:4]), int(d[4:6]), int(d[6:8]),
+                                int(t[0:2]), int(t[2:4]), int(t[4:6])
+                            )
+                        except ValueError:
+                            created_time = None
+                    if created_time is None:
+                        # 파일 생성 시간 대신 폴더 수정 시간 사용 (DirEntry에 캐시됨)
+                        created_time = datetime.datetime.fromtimestamp(entry.stat().st_mtime)
+
                     backups.append({
-                        "name": item,
+                        "name": entry.name,
                         "description": description,
                         "created": created_time,
-                        "path": item_path
+                        "path": entry.path
                     })
             
-            # 생성 시간 기준으로 최신순 정렬
-            backups.sort(key=lambda x: x["created"] if x["created"] else datetime.datetime.now(), reverse=True)
+            # 생성 시간 기준으로 최신순 정렬 (now()는 키 호출마다가 아니라 한 번만)
+            now = datetime.datetime.now()
+            backups.sort(key=lambda x: x["created"] or now, reverse=True)
             
             return backups
             